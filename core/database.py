@@ -1,65 +1,228 @@
 """
 Database module for tracking downloaded mods and application state.
 """
+import queue
 import sqlite3
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict
-from datetime import datetime
+from typing import List, Optional, Dict, Tuple
+
+# Lightweight row types for list reads - much cheaper to materialize than
+# one dict per row when the history grows large
+DownloadedMod = namedtuple(
+    "DownloadedMod",
+    "publishedfileid title download_date file_size last_updated workshop_url"
+)
+QueuedMod = namedtuple("QueuedMod", "publishedfileid title added_date")
 
 
 class ModDatabase:
     """Handles database operations for tracking downloaded mods."""
 
-    def __init__(self, db_path: str = "zomboid_mods.db"):
-        """Initialize database connection and create tables if needed."""
+    # Canonical SQL for hot queries. Keeping the text identical across calls
+    # lets sqlite3's statement cache reuse the prepared program instead of
+    # re-parsing the SQL every time.
+    _SQL_IS_DOWNLOADED = "SELECT 1 FROM downloaded_mods WHERE publishedfileid = ?"
+    _SQL_GET_WORKSHOP_URL = "SELECT workshop_url FROM downloaded_mods WHERE publishedfileid = ?"
+
+    # Maximum number of pooled connections kept alive for worker threads
+    POOL_SIZE = 4
+
+    # Bumped whenever an in-place migration is added; stored in
+    # PRAGMA user_version so migrations only run against older databases
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_path: str = "zomboid_mods.db", cache: bool = True, cache_size: int = 1024):
+        """
+        Initialize database connection and create tables if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+            cache: Cache hot lookups (is_mod_downloaded / get_mod_workshop_url)
+                   in memory; safe because this app is the only writer
+            cache_size: Maximum number of entries kept per lookup cache
+        """
         self.db_path = Path(db_path)
         self.conn = None
+        self._in_transaction = False
+        self._cache_enabled = cache
+        self._cache_size = cache_size
+        self._downloaded_cache: Dict[str, bool] = {}
+        self._url_cache: Dict[str, Optional[str]] = {}
+        self._pool: queue.Queue = queue.Queue(maxsize=self.POOL_SIZE)
         self._connect()
         self._create_tables()
 
+    def _cache_put(self, cache: Dict, key: str, value):
+        """Store a lookup result, evicting the oldest entry when full."""
+        if len(cache) >= self._cache_size:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new connection with the tuned pragma set."""
+        conn = sqlite3.connect(self.db_path, cached_statements=256, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+
+        # Tune SQLite for a desktop app: WAL allows the UI to read while a
+        # download writes, and NORMAL sync halves fsyncs per commit.
+        # These pragmas only make sense for an on-disk database.
+        if str(self.db_path) != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB mmap
+            conn.execute("PRAGMA busy_timeout=3000")
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+
+        return conn
+
     def _connect(self):
-        """Establish database connection."""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        """Establish the owner connection used by the GUI thread."""
+        self.conn = self._open_connection()
+        self._cursor = self.conn.cursor()  # Long-lived cursor for reads
+        # Second cursor returning plain tuples (no sqlite3.Row wrapping)
+        # for the namedtuple list reads
+        self._tuple_cursor = self.conn.cursor()
+        self._tuple_cursor.row_factory = None
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a pooled connection for use on a worker thread.
+
+        Connections are kept alive (with their page caches warm) until
+        close(), so workers never pay per-query connect/teardown cost.
+
+        Usage:
+            with db.connection() as conn:
+                conn.execute(...)
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
+
+        try:
+            yield conn
+        finally:
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
 
     def _create_tables(self):
         """Create necessary database tables."""
         cursor = self.conn.cursor()
 
-        # Downloaded mods table - check if workshop_url column exists, add if not
+        # Downloaded mods table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS downloaded_mods (
                 publishedfileid TEXT PRIMARY KEY,
                 title TEXT,
-                download_date TEXT,
+                download_date INTEGER,
                 file_size INTEGER,
-                last_updated TEXT,
+                last_updated INTEGER,
                 workshop_url TEXT
             )
         """)
 
-        # Add workshop_url column if it doesn't exist (for existing databases)
-        try:
-            cursor.execute("ALTER TABLE downloaded_mods ADD COLUMN workshop_url TEXT")
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-
         # Download queue table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS download_queue (
                 publishedfileid TEXT PRIMARY KEY,
                 title TEXT,
-                added_date TEXT
+                added_date INTEGER
             )
         """)
 
+        # Migrate older databases in place, but only when user_version says
+        # they predate the current schema - avoids schema-probing write
+        # statements on every launch
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] < self.SCHEMA_VERSION:
+            self._migrate(cursor)
+            cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+        # Indexes so the list queries walk an index instead of scanning
+        # and sorting the whole table on every refresh
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_downloaded_date ON downloaded_mods(download_date DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_queue_date ON download_queue(added_date)"
+        )
+
         self.conn.commit()
 
+    def _migrate(self, cursor):
+        """Bring a pre-versioning database up to the current schema."""
+        # v1: workshop_url column added to downloaded_mods
+        cursor.execute("PRAGMA table_info(downloaded_mods)")
+        columns = {row['name'] for row in cursor.fetchall()}
+        if 'workshop_url' not in columns:
+            cursor.execute("ALTER TABLE downloaded_mods ADD COLUMN workshop_url TEXT")
+
+        # v2: timestamps converted from ISO-8601 TEXT to epoch INTEGER
+        self._migrate_timestamps(cursor)
+
+    def _migrate_timestamps(self, cursor):
+        """
+        One-time migration of timestamp columns from ISO-8601 TEXT to
+        INTEGER epoch seconds (smaller records, cheaper index compares).
+        """
+        migrations = [
+            ("downloaded_mods", ("download_date", "last_updated"), "idx_downloaded_date"),
+            ("download_queue", ("added_date",), "idx_queue_date"),
+        ]
+
+        for table, columns, index in migrations:
+            cursor.execute(f"PRAGMA table_info({table})")
+            declared = {row['name']: (row['type'] or '').upper() for row in cursor.fetchall()}
+
+            for column in columns:
+                if declared.get(column) == 'INTEGER':
+                    continue  # Already migrated
+
+                # The index (if present) references the old column and would
+                # block DROP COLUMN; it is recreated by _create_tables
+                cursor.execute(f"DROP INDEX IF EXISTS {index}")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column}_i INTEGER")
+                cursor.execute(
+                    f"UPDATE {table} SET {column}_i = CAST(strftime('%s', {column}) AS INTEGER)"
+                )
+                cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+                cursor.execute(f"ALTER TABLE {table} RENAME COLUMN {column}_i TO {column}")
+
+    def _commit(self):
+        """Commit unless a surrounding transaction() block owns the commit."""
+        if not self._in_transaction:
+            self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several add/remove calls into a single commit.
+
+        Usage:
+            with db.transaction():
+                db.add_to_queue(...)
+                db.remove_from_queue(...)
+        """
+        self._in_transaction = True
+        try:
+            with self.conn:
+                yield
+        finally:
+            self._in_transaction = False
+
     def add_downloaded_mod(self, publishedfileid: str, title: str, file_size: int = 0, workshop_url: str = ""):
         """Add a mod to the downloaded mods list."""
         cursor = self.conn.cursor()
-        now = datetime.now().isoformat()
+        now = int(time.time())
 
         cursor.execute("""
             INSERT OR REPLACE INTO downloaded_mods
@@ -67,32 +230,128 @@ class ModDatabase:
             VALUES (?, ?, ?, ?, ?, ?)
         """, (publishedfileid, title, now, file_size, now, workshop_url))
 
-        self.conn.commit()
+        self._commit()
+        self._downloaded_cache.pop(publishedfileid, None)
+        self._url_cache.pop(publishedfileid, None)
+
+    def add_downloaded_mods_bulk(self, rows: List[Tuple[str, str, int, str]]):
+        """
+        Add many downloaded mods in a single transaction.
+
+        Args:
+            rows: List of (publishedfileid, title, file_size, workshop_url) tuples
+        """
+        if not rows:
+            return
+
+        now = int(time.time())
+        with self.conn:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO downloaded_mods
+                (publishedfileid, title, download_date, file_size, last_updated, workshop_url)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(pfid, title, now, size, now, url) for pfid, title, size, url in rows])
+
+        self._downloaded_cache.clear()
+        self._url_cache.clear()
 
     def get_mod_workshop_url(self, publishedfileid: str) -> Optional[str]:
         """Get workshop URL for a mod."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT workshop_url FROM downloaded_mods WHERE publishedfileid = ?",
-            (publishedfileid,)
-        )
-        result = cursor.fetchone()
-        return result['workshop_url'] if result else None
+        if self._cache_enabled and publishedfileid in self._url_cache:
+            return self._url_cache[publishedfileid]
+
+        self._cursor.execute(self._SQL_GET_WORKSHOP_URL, (publishedfileid,))
+        result = self._cursor.fetchone()
+        url = result['workshop_url'] if result else None
+
+        if self._cache_enabled:
+            self._cache_put(self._url_cache, publishedfileid, url)
+        return url
+
+    def get_workshop_urls(self, publishedfileids: List[str]) -> Dict[str, str]:
+        """
+        Get workshop URLs for many mods in one query per 500 IDs.
+
+        Returns:
+            Mapping of publishedfileid to workshop_url for rows that have one
+        """
+        urls: Dict[str, str] = {}
+        for start in range(0, len(publishedfileids), 500):
+            chunk = publishedfileids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            self._cursor.execute(
+                "SELECT publishedfileid, workshop_url FROM downloaded_mods "
+                f"WHERE workshop_url IS NOT NULL AND workshop_url != '' "
+                f"AND publishedfileid IN ({placeholders})",
+                chunk
+            )
+            urls.update((row[0], row[1]) for row in self._cursor.fetchall())
+        return urls
 
     def is_mod_downloaded(self, publishedfileid: str) -> bool:
         """Check if a mod has been downloaded."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT 1 FROM downloaded_mods WHERE publishedfileid = ?",
-            (publishedfileid,)
-        )
-        return cursor.fetchone() is not None
+        if self._cache_enabled and publishedfileid in self._downloaded_cache:
+            return self._downloaded_cache[publishedfileid]
 
-    def get_downloaded_mods(self) -> List[Dict]:
-        """Get list of all downloaded mods."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM downloaded_mods ORDER BY download_date DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        self._cursor.execute(self._SQL_IS_DOWNLOADED, (publishedfileid,))
+        downloaded = self._cursor.fetchone() is not None
+
+        if self._cache_enabled:
+            self._cache_put(self._downloaded_cache, publishedfileid, downloaded)
+        return downloaded
+
+    def _which_in_table(self, table: str, publishedfileids: List[str]) -> set:
+        """Return the subset of the given IDs present in a table, one query per 500 IDs."""
+        found = set()
+        for start in range(0, len(publishedfileids), 500):
+            chunk = publishedfileids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            self._cursor.execute(
+                f"SELECT publishedfileid FROM {table} WHERE publishedfileid IN ({placeholders})",
+                chunk
+            )
+            found.update(row['publishedfileid'] for row in self._cursor.fetchall())
+        return found
+
+    def which_downloaded(self, publishedfileids: List[str]) -> set:
+        """
+        Return the subset of the given IDs that have been downloaded.
+
+        One query per 500 IDs instead of one is_mod_downloaded call per ID.
+        """
+        return self._which_in_table("downloaded_mods", publishedfileids)
+
+    def which_queued(self, publishedfileids: List[str]) -> set:
+        """Return the subset of the given IDs currently in the download queue."""
+        return self._which_in_table("download_queue", publishedfileids)
+
+    # Explicit column lists: migrated databases have a different physical
+    # column order than freshly created ones, so SELECT * is not stable
+    _SQL_LIST_DOWNLOADED = (
+        "SELECT publishedfileid, title, download_date, file_size, last_updated, workshop_url "
+        "FROM downloaded_mods ORDER BY download_date DESC"
+    )
+    _SQL_LIST_QUEUE = (
+        "SELECT publishedfileid, title, added_date "
+        "FROM download_queue ORDER BY added_date"
+    )
+
+    def get_downloaded_mods(self, limit: Optional[int] = None, offset: int = 0) -> List[DownloadedMod]:
+        """
+        Get list of downloaded mods, most recent first.
+
+        Args:
+            limit: Maximum number of rows to return (all rows if None)
+            offset: Number of rows to skip
+        """
+        if limit is not None:
+            self._tuple_cursor.execute(
+                self._SQL_LIST_DOWNLOADED + " LIMIT ? OFFSET ?",
+                (limit, offset)
+            )
+        else:
+            self._tuple_cursor.execute(self._SQL_LIST_DOWNLOADED)
+        return list(map(DownloadedMod._make, self._tuple_cursor.fetchall()))
 
     def remove_downloaded_mod(self, publishedfileid: str):
         """Remove a mod from downloaded list."""
@@ -101,12 +360,19 @@ class ModDatabase:
             "DELETE FROM downloaded_mods WHERE publishedfileid = ?",
             (publishedfileid,)
         )
-        self.conn.commit()
+        if cursor.rowcount > 0:
+            self._commit()
+        elif not self._in_transaction:
+            # No-op delete: roll back the implicit transaction instead of
+            # paying for a commit (rollback of an empty txn does no I/O)
+            self.conn.rollback()
+        self._downloaded_cache.pop(publishedfileid, None)
+        self._url_cache.pop(publishedfileid, None)
 
     def add_to_queue(self, publishedfileid: str, title: str):
         """Add a mod to the download queue."""
         cursor = self.conn.cursor()
-        now = datetime.now().isoformat()
+        now = int(time.time())
 
         cursor.execute("""
             INSERT OR REPLACE INTO download_queue
@@ -114,7 +380,25 @@ class ModDatabase:
             VALUES (?, ?, ?)
         """, (publishedfileid, title, now))
 
-        self.conn.commit()
+        self._commit()
+
+    def add_to_queue_bulk(self, rows: List[Tuple[str, str]]):
+        """
+        Add many mods to the download queue in a single transaction.
+
+        Args:
+            rows: List of (publishedfileid, title) tuples
+        """
+        if not rows:
+            return
+
+        now = int(time.time())
+        with self.conn:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO download_queue
+                (publishedfileid, title, added_date)
+                VALUES (?, ?, ?)
+            """, [(pfid, title, now) for pfid, title in rows])
 
     def remove_from_queue(self, publishedfileid: str):
         """Remove a mod from the download queue."""
@@ -123,21 +407,49 @@ class ModDatabase:
             "DELETE FROM download_queue WHERE publishedfileid = ?",
             (publishedfileid,)
         )
-        self.conn.commit()
+        if cursor.rowcount > 0:
+            self._commit()
+        elif not self._in_transaction:
+            self.conn.rollback()
+
+    def remove_from_queue_bulk(self, publishedfileids: List[str]):
+        """
+        Remove many mods from the download queue in a single transaction.
+
+        Args:
+            publishedfileids: Workshop IDs to remove
+        """
+        if not publishedfileids:
+            return
 
-    def get_queue(self) -> List[Dict]:
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM download_queue WHERE publishedfileid = ?",
+                [(pfid,) for pfid in publishedfileids]
+            )
+
+    def get_queue(self) -> List[QueuedMod]:
         """Get all mods in the download queue."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM download_queue ORDER BY added_date")
-        return [dict(row) for row in cursor.fetchall()]
+        self._tuple_cursor.execute(self._SQL_LIST_QUEUE)
+        return list(map(QueuedMod._make, self._tuple_cursor.fetchall()))
 
     def clear_queue(self):
         """Clear all mods from the download queue."""
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM download_queue")
-        self.conn.commit()
+        if cursor.rowcount > 0:
+            self._commit()
+        elif not self._in_transaction:
+            self.conn.rollback()
 
     def close(self):
-        """Close database connection."""
+        """Close the owner connection and any pooled connections."""
+        self._downloaded_cache.clear()
+        self._url_cache.clear()
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
         if self.conn:
             self.conn.close()
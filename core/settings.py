@@ -5,6 +5,8 @@ import json
 from pathlib import Path
 from typing import Optional
 
+from PySide6.QtCore import QTimer, QCoreApplication
+
 
 class Settings:
     """Manages application settings with persistence."""
@@ -19,10 +21,16 @@ class Settings:
         "window_height": 800,
     }
 
+    # How long to coalesce rapid mutations (resize drags, checkbox toggles)
+    # before rewriting settings.json
+    FLUSH_DELAY_MS = 500
+
     def __init__(self, settings_file: str = "settings.json"):
         """Initialize settings manager."""
         self.settings_file = Path(settings_file)
         self.settings = self.DEFAULT_SETTINGS.copy()
+        self._dirty = False
+        self._flush_timer: Optional[QTimer] = None
         self.load()
 
     def load(self):
@@ -44,14 +52,40 @@ class Settings:
         except Exception as e:
             print(f"Error saving settings: {e}")
 
+    def flush(self):
+        """Write pending changes to disk, if any."""
+        if self._dirty:
+            self._dirty = False
+            self.save()
+
+    def _schedule_flush(self):
+        """Mark settings dirty and debounce the disk write."""
+        self._dirty = True
+
+        app = QCoreApplication.instance()
+        if app is None:
+            # No event loop to debounce with - write immediately
+            self.flush()
+            return
+
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+            self._flush_timer.timeout.connect(self.flush)
+            # Make sure nothing is lost if the app quits mid-debounce
+            app.aboutToQuit.connect(self.flush)
+
+        self._flush_timer.start()
+
     def get(self, key: str, default=None):
         """Get a setting value."""
         return self.settings.get(key, default)
 
     def set(self, key: str, value):
-        """Set a setting value and save."""
+        """Set a setting value and schedule a save."""
         self.settings[key] = value
-        self.save()
+        self._schedule_flush()
 
     @property
     def steamcmd_path(self) -> str:
@@ -113,4 +147,4 @@ class Settings:
         """Save window size."""
         self.settings["window_width"] = width
         self.settings["window_height"] = height
-        self.save()
+        self._schedule_flush()
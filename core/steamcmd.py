@@ -1,11 +1,15 @@
 """
 SteamCMD wrapper for downloading Workshop mods.
 """
+import errno
+import os
+import re
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Callable
-from PySide6.QtCore import QProcess, QObject, Signal
+from PySide6.QtCore import QProcess, QObject, QRunnable, QThreadPool, QTimer, Signal
 
 
 class SteamCMDWrapper(QObject):
@@ -20,6 +24,20 @@ class SteamCMDWrapper(QObject):
 
     PROJECT_ZOMBOID_APP_ID = "108600"
 
+    # How long to accumulate raw output before decoding and emitting it -
+    # keeps Qt signal traffic at ~20 Hz instead of one emit per chunk
+    OUTPUT_FLUSH_MS = 50
+
+    # Progress needles matched in one pass over the raw output bytes
+    # instead of several substring scans per chunk
+    _PROGRESS_RE = re.compile(rb"Success|fully installed|Downloading|Update state")
+    _PROGRESS_MESSAGES = {
+        b"Success": "Download successful",
+        b"fully installed": "Download successful",
+        b"Downloading": "Downloading...",
+        b"Update state": "Updating...",
+    }
+
     def __init__(self, steamcmd_path: str, mod_download_path: str):
         """
         Initialize SteamCMD wrapper.
@@ -31,10 +49,22 @@ class SteamCMDWrapper(QObject):
         super().__init__()
         self.steamcmd_path = Path(steamcmd_path)
         self.mod_download_path = Path(mod_download_path)
+        # Precomputed once - these chains are rebuilt per mod otherwise
+        self._steamapps_folder = self.mod_download_path / "steamapps"
+        self._workshop_base = (
+            self._steamapps_folder / "workshop" / "content" / self.PROJECT_ZOMBOID_APP_ID
+        )
         self.process: Optional[QProcess] = None
         self.is_running = False
         self.current_download_ids: List[str] = []
 
+        # Raw stdout accumulates here and is decoded/emitted on a timer tick
+        self._stdout_buffer = bytearray()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.OUTPUT_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_output)
+
     def validate_paths(self) -> tuple[bool, str]:
         """
         Validate that SteamCMD path exists.
@@ -101,7 +131,6 @@ class SteamCMDWrapper(QObject):
                 cmd_parts.extend(["+login", username])
 
         # Force install directory (important for Workshop content)
-        workshop_content_path = self.mod_download_path / "steamapps" / "workshop" / "content" / self.PROJECT_ZOMBOID_APP_ID
         cmd_parts.extend(["+force_install_dir", str(self.mod_download_path)])
 
         # Add download commands for each mod
@@ -142,47 +171,91 @@ class SteamCMDWrapper(QObject):
     def _handle_stdout(self):
         """Handle standard output from SteamCMD."""
         if self.process:
-            data = self.process.readAllStandardOutput()
-            if data:
-                output = data.data().decode('utf-8', errors='replace')
-                if output:  # Only emit if there's actual output
-                    self.output_received.emit(output)
-                    print(f"[SteamCMD Output] {output.strip()}")  # Debug print
-
-                    # Parse for progress indicators
-                    if "Success" in output or "fully installed" in output:
-                        self.download_progress.emit("Download successful")
-                    elif "Downloading" in output:
-                        self.download_progress.emit("Downloading...")
-                    elif "Update state" in output:
-                        self.download_progress.emit("Updating...")
+            raw = bytes(self.process.readAllStandardOutput())
+            if raw:
+                # Parse for progress indicators (single regex pass on bytes)
+                match = self._PROGRESS_RE.search(raw)
+                if match:
+                    self.download_progress.emit(self._PROGRESS_MESSAGES[match.group(0)])
+
+                # Accumulate raw bytes; decoding and the signal emit happen
+                # on the flush timer tick
+                self._stdout_buffer += raw
+                if not self._flush_timer.isActive():
+                    self._flush_timer.start()
+
+    def _flush_output(self):
+        """Decode and emit any buffered SteamCMD output."""
+        if self._stdout_buffer:
+            output = bytes(self._stdout_buffer).decode('utf-8', errors='replace')
+            self._stdout_buffer.clear()
+            self.output_received.emit(output)
+            print(f"[SteamCMD Output] {output.strip()}")  # Debug print
 
     def _handle_stderr(self):
         """Handle standard error from SteamCMD."""
         if self.process:
-            data = self.process.readAllStandardError()
-            if data:
-                output = data.data().decode('utf-8', errors='replace')
-                if output:  # Only emit if there's actual output
-                    self.output_received.emit(f"ERROR: {output}")
-                    print(f"[SteamCMD Error] {output.strip()}")  # Debug print
+            raw = bytes(self.process.readAllStandardError())
+            if raw:
+                output = raw.decode('utf-8', errors='replace')
+                self.output_received.emit(f"ERROR: {output}")
+                print(f"[SteamCMD Error] {output.strip()}")  # Debug print
 
     def _handle_finished(self, exit_code: int, exit_status):
         """Handle process completion."""
         self.is_running = False
+        self._flush_output()  # Don't let buffered output trail the summary
 
         if exit_code == 0:
-            # Process downloaded mods (move from workshop folder to final location)
+            # Process downloaded mods (move from workshop folder to final
+            # location) on a worker thread so the GUI stays responsive;
+            # signals emitted from the worker are queued back automatically
             self.output_received.emit("\n\nProcessing downloaded mods...\n")
-            success, message = self._process_downloaded_mods()
-
-            if success:
-                self.download_finished.emit(True, "Download completed and mods processed successfully")
-            else:
-                self.download_finished.emit(False, f"Download completed but processing failed: {message}")
+            QThreadPool.globalInstance().start(_PostProcessRunnable(self))
         else:
             self.download_finished.emit(False, f"SteamCMD exited with code {exit_code}")
 
+    def _move_replacing(self, src: Path, dest: Path):
+        """
+        Move src to dest, replacing anything already there.
+
+        os.replace is a single atomic rename when src and dest are on the
+        same filesystem (the common case here: SteamCMD downloads into a
+        subdir of mod_download_path), avoiding the per-file copy walk and
+        the extra exists()/is_dir() stat calls. Destinations that a rename
+        cannot replace (non-empty directories, any directory on Windows)
+        are removed and the rename retried; only a cross-device move falls
+        back to shutil.move.
+
+        Args:
+            src: Source path
+            dest: Destination path
+        """
+        try:
+            os.replace(src, dest)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                # Rename refused to replace the existing destination -
+                # clear it and retry once
+                if dest.is_dir() and not dest.is_symlink():
+                    shutil.rmtree(dest)
+                elif dest.exists() or dest.is_symlink():
+                    dest.unlink()
+                try:
+                    os.replace(src, dest)
+                    return
+                except OSError as retry_error:
+                    if retry_error.errno != errno.EXDEV:
+                        raise
+
+        # Different filesystem: copy+delete is the only option
+        if dest.is_dir() and not dest.is_symlink():
+            shutil.rmtree(dest)
+        elif dest.exists():
+            dest.unlink()
+        shutil.move(str(src), str(dest))
+
     def _process_downloaded_mods(self) -> tuple[bool, str]:
         """
         Process downloaded mods by moving them from workshop folder to final location.
@@ -194,12 +267,14 @@ class SteamCMDWrapper(QObject):
             Tuple of (success, message)
         """
         try:
-            workshop_base = self.mod_download_path / "steamapps" / "workshop" / "content" / self.PROJECT_ZOMBOID_APP_ID
+            workshop_base = self._workshop_base
 
             if not workshop_base.exists():
                 return False, f"Workshop folder not found: {workshop_base}"
 
-            processed_count = 0
+            # Collect all independent (src, dest) moves first so they can run
+            # in parallel - the GIL releases during filesystem I/O
+            jobs = []  # (publishedfileid, src, dest, folder_name)
             for publishedfileid in self.current_download_ids:
                 workshop_mod_folder = workshop_base / publishedfileid
 
@@ -207,58 +282,51 @@ class SteamCMDWrapper(QObject):
                     self.output_received.emit(f"⚠ Warning: Mod {publishedfileid} not found in workshop folder\n")
                     continue
 
-                # Track which folders were created for this workshop ID
-                created_folders = []
-
-                # Check if there's a 'mods' subfolder (common in PZ workshop items)
+                # Check if there's a 'mods' subfolder (common in PZ workshop
+                # items); os.scandir gives us names from a single directory
+                # read instead of a stat per entry
                 mods_subfolder = workshop_mod_folder / "mods"
+                try:
+                    with os.scandir(mods_subfolder) as entries:
+                        mod_entries = [(entry.name, entry.path) for entry in entries]
+                except (FileNotFoundError, NotADirectoryError):
+                    mod_entries = None
 
-                if mods_subfolder.exists() and mods_subfolder.is_dir():
-                    # Move contents from the mods subfolder
+                if mod_entries is not None:
                     self.output_received.emit(f"Processing mod {publishedfileid}...\n")
-
-                    for item in mods_subfolder.iterdir():
-                        dest = self.mod_download_path / item.name
-
-                        # Remove destination if it exists
-                        if dest.exists():
-                            if dest.is_dir():
-                                shutil.rmtree(dest)
-                            else:
-                                dest.unlink()
-
-                        # Move the mod folder
-                        shutil.move(str(item), str(dest))
-                        self.output_received.emit(f"  ✓ Moved {item.name} to {self.mod_download_path}\n")
-                        created_folders.append(item.name)
-
-                    processed_count += 1
+                    for name, path in mod_entries:
+                        jobs.append((publishedfileid, Path(path), self.mod_download_path / name, name))
                 else:
                     # No mods subfolder, move the entire workshop folder
                     self.output_received.emit(f"Processing mod {publishedfileid} (no mods subfolder)...\n")
-                    dest = self.mod_download_path / publishedfileid
-
-                    if dest.exists():
-                        if dest.is_dir():
-                            shutil.rmtree(dest)
-                        else:
-                            dest.unlink()
-
-                    shutil.move(str(workshop_mod_folder), str(dest))
-                    self.output_received.emit(f"  ✓ Moved {publishedfileid} to {self.mod_download_path}\n")
-                    created_folders.append(publishedfileid)
-                    processed_count += 1
-
+                    jobs.append((publishedfileid, workshop_mod_folder,
+                                 self.mod_download_path / publishedfileid, publishedfileid))
+
+            # Run the moves on a small thread pool and wait for all of them
+            if jobs:
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                    futures = [executor.submit(self._move_replacing, src, dest)
+                               for _, src, dest, _ in jobs]
+                    for future in as_completed(futures):
+                        future.result()  # Surface any move error
+
+            # Report results and emit per-mod signals in queue order
+            created_by_mod = {}
+            for publishedfileid, _, _, folder_name in jobs:
+                self.output_received.emit(f"  ✓ Moved {folder_name} to {self.mod_download_path}\n")
+                created_by_mod.setdefault(publishedfileid, []).append(folder_name)
+
+            processed_count = len(created_by_mod)
+            for publishedfileid, created_folders in created_by_mod.items():
                 # Emit signal with the mapping of workshop ID to created folders
-                if created_folders:
-                    self.mod_processed.emit(publishedfileid, created_folders)
+                self.mod_processed.emit(publishedfileid, created_folders)
 
             # Clean up steamapps folder (entire temporary structure)
-            steamapps_folder = self.mod_download_path / "steamapps"
             try:
-                if steamapps_folder.exists():
-                    shutil.rmtree(steamapps_folder)
-                    self.output_received.emit("\nCleaned up temporary SteamCMD files\n")
+                shutil.rmtree(self._steamapps_folder)
+                self.output_received.emit("\nCleaned up temporary SteamCMD files\n")
+            except FileNotFoundError:
+                pass  # Nothing to clean up
             except Exception as e:
                 self.output_received.emit(f"\n⚠ Warning: Could not clean up steamapps folder: {e}\n")
 
@@ -273,6 +341,7 @@ class SteamCMDWrapper(QObject):
     def cancel_download(self):
         """Cancel the current download."""
         if self.process and self.is_running:
+            self._flush_output()
             self.output_received.emit("\nCancelling download...\n")
             self.process.kill()
             self.is_running = False
@@ -288,11 +357,28 @@ class SteamCMDWrapper(QObject):
         Returns:
             Path to the mod directory
         """
-        return (
-            self.mod_download_path
-            / "steamapps"
-            / "workshop"
-            / "content"
-            / self.PROJECT_ZOMBOID_APP_ID
-            / publishedfileid
-        )
+        return self._workshop_base / publishedfileid
+
+
+class _PostProcessRunnable(QRunnable):
+    """Runs post-download mod processing off the GUI thread."""
+
+    def __init__(self, wrapper: SteamCMDWrapper):
+        """
+        Initialize the runnable.
+
+        Args:
+            wrapper: The SteamCMDWrapper whose download just finished
+        """
+        super().__init__()
+        self._wrapper = wrapper
+
+    def run(self):
+        """Move the downloaded mods into place and report the outcome."""
+        wrapper = self._wrapper
+        success, message = wrapper._process_downloaded_mods()
+
+        if success:
+            wrapper.download_finished.emit(True, "Download completed and mods processed successfully")
+        else:
+            wrapper.download_finished.emit(False, f"Download completed but processing failed: {message}")
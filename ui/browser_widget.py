@@ -3,23 +3,460 @@ Steam Workshop browser widget with JavaScript injection for mod selection.
 """
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QFileDialog, QMessageBox
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineScript
-from PySide6.QtCore import QUrl, Signal, Slot
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineScript
+from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtCore import QFile, QIODevice, QObject, QUrl, Signal, Slot
 import json
 
 
+# The injected script body is built once at import time; only the tiny
+# installed-IDs prelude changes between injections
+_JS_TEMPLATE = """
+(function() {
+    // Diagnostics are off unless window.__zomboidDebug is set, so release
+    // runs skip both the string construction and the console IPC
+    function debugLog() {
+        if (window.__zomboidDebug) {
+            console.log.apply(console, arguments);
+        }
+    }
+
+    debugLog('Zomboid Mod Downloader: Injecting buttons...');
+
+    // One shared stylesheet: buttons carry only a class name, and hover
+    // effects run as CSS :hover instead of per-button JS listeners
+    // mutating inline styles
+    if (!document.getElementById('zomboid-btn-styles')) {
+        const style = document.createElement('style');
+        style.id = 'zomboid-btn-styles';
+        style.textContent = `
+            .zomboid-queue-btn, .zomboid-main-add-btn {
+                position: absolute;
+                top: 8px;
+                right: 8px;
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                color: white;
+                text-align: center;
+                cursor: pointer;
+                font-weight: bold;
+                z-index: 1000;
+                opacity: 0.9;
+                transition: all 0.2s ease;
+                user-select: none;
+            }
+            .zomboid-queue-btn {
+                padding: 6px 12px;
+                border-radius: 3px;
+                font-size: 11px;
+                box-shadow: 0 2px 6px rgba(0,0,0,0.3);
+            }
+            .zomboid-main-add-btn {
+                padding: 8px 16px;
+                border-radius: 4px;
+                font-size: 14px;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.4);
+            }
+            .zomboid-queue-btn:hover, .zomboid-main-add-btn:hover {
+                opacity: 1;
+                transform: scale(1.05);
+            }
+            .zomboid-queue-btn:hover { box-shadow: 0 3px 8px rgba(0,0,0,0.4); }
+            .zomboid-main-add-btn:hover { box-shadow: 0 3px 10px rgba(0,0,0,0.5); }
+            .zomboid-btn--installed {
+                background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
+                cursor: default;
+                opacity: 0.8;
+            }
+            .zomboid-btn--installed:hover {
+                opacity: 0.8;
+                transform: none;
+            }
+            .zomboid-btn--added {
+                background: linear-gradient(135deg, #56ab2f 0%, #a8e063 100%);
+            }
+        `;
+        document.head.appendChild(style);
+    }
+
+    // List of installed mod IDs (refreshed in place via __zomboidRefresh)
+    let installedMods = window.__zomboidInstalled || new Set();
+
+    // One combined selector covering every workshop-item shape we handle,
+    // with required-items sections excluded natively by the selector
+    // engine instead of a JS filter pass afterwards
+    const NOT_REQUIRED = ':not([class*="required" i]):not([id*="required" i])' +
+                         ':not([class*="required" i] *):not([id*="required" i] *)';
+    const ITEM_SELECTOR = ['.workshopItem', '.workshop_item',
+                           'div[class*="workshopItem"]', 'div[id*="sharedfile"]']
+        .map(s => s + NOT_REQUIRED).join(', ');
+
+    // Workshop item ID extractor, compiled once for every call site
+    const ID_RE = /[?&]id=(\\d+)/;
+
+    // Selectors for the required-items sections on detail pages
+    const REQUIRED_SECTION_SELECTORS = [
+        '.requiredItemsContainer',
+        '.requiredItems',
+        '#RequiredItems',
+        '[class*="equiredItem"]'
+    ];
+
+    // Items already given a button; O(1) dedup that lets the GC drop
+    // entries when the page discards the nodes
+    let seen = new WeakSet();
+
+    // Hand a mod to Python over the QWebChannel bridge
+    function notifyAddMod(publishedfileid, title) {
+        if (window.zomboid) {
+            window.zomboid.addMod(publishedfileid, title);
+        }
+    }
+
+    // Hand several mods over in one round-trip
+    function notifyAddModBatch(mods) {
+        if (window.zomboid) {
+            window.zomboid.addModBatch(JSON.stringify(mods));
+        }
+    }
+
+    // One delegated click handler covers every queue button, instead of
+    // a closure-holding listener per button
+    document.body.addEventListener('click', function(e) {
+        const btn = e.target.closest('.zomboid-queue-btn:not(.zomboid-btn--installed)');
+        if (!btn) {
+            return;
+        }
+        e.preventDefault();
+        e.stopPropagation();
+
+        btn.textContent = '✓';
+        btn.classList.add('zomboid-btn--added');
+
+        notifyAddMod(btn.dataset.id, btn.dataset.title);
+
+        setTimeout(() => {
+            btn.textContent = 'Add';
+            btn.classList.remove('zomboid-btn--added');
+        }, 2000);
+    });
+
+    // Function to add 'Add to Queue' button to a mod item
+    function addQueueButton(workshopItem) {
+        // Skip if this item was already processed
+        if (seen.has(workshopItem)) {
+            return;
+        }
+        seen.add(workshopItem);
+
+        // Get mod information from multiple possible locations
+        let link = workshopItem.querySelector('a');
+        if (!link) {
+            debugLog('No link found in workshop item');
+            return;
+        }
+
+        const url = link.href;
+        const match = url.match(ID_RE);
+        if (!match) {
+            debugLog('No ID found in URL:', url);
+            return;
+        }
+
+        const publishedfileid = match[1];
+
+        // Try multiple selectors for title
+        let title = 'Unknown Mod';
+        const titleElement = workshopItem.querySelector('.workshopItemTitle') ||
+                           workshopItem.querySelector('.workshop_item_title') ||
+                           workshopItem.querySelector('div[class*="title"]');
+        if (titleElement) {
+            title = titleElement.textContent.trim();
+        }
+
+        debugLog('Found mod:', publishedfileid, title);
+
+        // Check if mod is already installed
+        const isInstalled = installedMods.has(publishedfileid);
+
+        // Create button container
+        const buttonContainer = document.createElement('div');
+
+        if (isInstalled) {
+            buttonContainer.className = 'zomboid-queue-btn zomboid-btn--installed';
+            buttonContainer.textContent = 'Installed';
+        } else {
+            // Clicks are handled by the delegated listener; the button
+            // only carries its payload as data attributes
+            buttonContainer.className = 'zomboid-queue-btn';
+            buttonContainer.textContent = 'Add';
+            buttonContainer.dataset.id = publishedfileid;
+            buttonContainer.dataset.title = title;
+        }
+
+        // Make parent position relative for absolute positioning
+        workshopItem.style.position = 'relative';
+        workshopItem.appendChild(buttonContainer);
+    }
+
+    // Add buttons to all workshop items (excluding required items and detail pages)
+    let retries = 0;
+    function addButtonsToAllItems() {
+        // Don't add buttons on detail pages (only in browse/search listings)
+        if (window.location.href.includes('?id=')) {
+            debugLog('On detail page, skipping thumbnail button injection');
+            return;
+        }
+
+        // Single comma-separated selector: one DOM walk, no filter pass
+        const items = document.querySelectorAll(ITEM_SELECTOR);
+        if (items.length > 0) {
+            debugLog('Found', items.length, 'workshop items');
+            items.forEach(addQueueButton);
+        } else if (++retries < 5) {
+            // Listings can populate late; pages with no items at all
+            // stop polling after 5 attempts
+            debugLog('No workshop items found. Retrying in 1 second...');
+            setTimeout(addButtonsToAllItems, 1000);
+        }
+    }
+
+
+    // Add buttons only within a freshly inserted subtree; addQueueButton
+    // itself skips required-items sections and already-decorated items
+    function scanAddedNode(node) {
+        if (node.matches && node.matches(ITEM_SELECTOR)) {
+            addQueueButton(node);
+        }
+        if (node.querySelectorAll) {
+            node.querySelectorAll(ITEM_SELECTOR).forEach(addQueueButton);
+        }
+    }
+
+    // Inject as soon as the DOM is ready instead of on wall-clock timers
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', addButtonsToAllItems, { once: true });
+    } else {
+        addButtonsToAllItems();
+    }
+
+    // Watch for new items (pagination, infinite scroll). Coalesce bursts
+    // of mutations into at most one pass per animation frame, and only
+    // scan the subtrees that were actually inserted rather than the
+    // whole document.
+    let scanPending = false;
+    let pendingNodes = [];
+    const observer = new MutationObserver(function(mutations) {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) {
+                    pendingNodes.push(node);
+                }
+            }
+        }
+        if (pendingNodes.length === 0 || scanPending) return;
+        scanPending = true;
+        requestAnimationFrame(() => {
+            scanPending = false;
+            const nodes = pendingNodes;
+            pendingNodes = [];
+            // Thumbnail buttons only belong on browse/search listings
+            if (!window.location.href.includes('?id=')) {
+                nodes.forEach(scanAddedNode);
+            }
+        });
+    });
+
+    // Observe the body for changes
+    setTimeout(() => {
+        const container = document.querySelector('#workshopBrowseItems') ||
+                        document.querySelector('#workshop_browse_items') ||
+                        document.body;
+        observer.observe(container, {
+            childList: true,
+            subtree: true
+        });
+        debugLog('Observing container for changes');
+    }, 1000);
+
+    // Add "Add to Download Queue" button on main image (top-right corner)
+    function addDetailPageButtons() {
+        // Only run on item detail pages
+        if (window.location.href.includes('?id=')) {
+            // Get current item ID from URL
+            const urlMatch = window.location.href.match(ID_RE);
+            if (urlMatch) {
+                const itemId = urlMatch[1];
+                const isInstalled = installedMods.has(itemId);
+
+                // Get title from page
+                const titleElem = document.querySelector('.workshopItemTitle');
+                const title = titleElem ? titleElem.textContent.trim() : 'Workshop Item';
+
+                // Add button on main image (top-right corner)
+                if (!document.querySelector('.zomboid-main-add-btn')) {
+                    const imageContainer = document.querySelector('.workshopItemPreviewImageMain') ||
+                                          document.querySelector('.highlight_player_area');
+
+                    if (imageContainer) {
+                        imageContainer.style.position = 'relative';
+
+                        const addBtn = document.createElement('div');
+
+                        if (isInstalled) {
+                            addBtn.className = 'zomboid-main-add-btn zomboid-btn--installed';
+                            addBtn.textContent = '✓ Installed';
+                        } else {
+                            addBtn.className = 'zomboid-main-add-btn';
+                            addBtn.textContent = 'Add';
+
+                            addBtn.addEventListener('click', function(e) {
+                                e.preventDefault();
+                                e.stopPropagation();
+
+                                this.textContent = '✓';
+                                this.classList.add('zomboid-btn--added');
+
+                                // Collect the main mod plus its required
+                                // items, then ship them as one batch
+                                const batch = [{ id: itemId, title: title }];
+
+                                // Find and add all required items
+                                debugLog('Searching for required items...');
+
+                                // Use a Set to track already-processed IDs (avoid duplicates)
+                                const processedIds = new Set();
+
+                                // First, find all links in the required items section
+                                const requiredSections =
+                                    REQUIRED_SECTION_SELECTORS.map(s => document.querySelector(s));
+
+                                // Remove duplicates and null values
+                                const uniqueSections = [...new Set(requiredSections)].filter(s => s !== null);
+
+                                let requiredCount = 0;
+                                uniqueSections.forEach(section => {
+                                    debugLog('Found required items section:', section.className || section.id);
+
+                                    // Find all links in this section
+                                    const links = section.querySelectorAll('a[href*="?id="]');
+                                    debugLog('Found ' + links.length + ' links in required section');
+
+                                    links.forEach(link => {
+                                        const url = link.href;
+                                        const match = url.match(ID_RE);
+                                        if (match) {
+                                            const reqId = match[1];
+
+                                            // Skip if already processed
+                                            if (processedIds.has(reqId)) {
+                                                debugLog('Skipping duplicate required item:', reqId);
+                                                return;
+                                            }
+                                            processedIds.add(reqId);
+
+                                            // Get title - try multiple approaches
+                                            let reqTitle = 'Required Item';
+
+                                            // Try getting title from link text
+                                            if (link.textContent && link.textContent.trim()) {
+                                                reqTitle = link.textContent.trim();
+                                            } else {
+                                                // Try finding title in parent elements
+                                                const parent = link.closest('.workshopItem') || link.parentElement;
+                                                const titleElem = parent?.querySelector('.workshopItemTitle') ||
+                                                                parent?.querySelector('.workshop_item_title') ||
+                                                                parent?.querySelector('div[class*="title"]');
+                                                if (titleElem) {
+                                                    reqTitle = titleElem.textContent.trim();
+                                                }
+                                            }
+
+                                            batch.push({ id: reqId, title: reqTitle });
+                                            requiredCount++;
+                                        }
+                                    });
+                                });
+
+                                if (requiredCount > 0) {
+                                    debugLog('Added ' + requiredCount + ' required items to queue');
+                                } else {
+                                    debugLog('No required items found');
+                                }
+
+                                notifyAddModBatch(batch);
+
+                                setTimeout(() => {
+                                    this.textContent = 'Add';
+                                    this.classList.remove('zomboid-btn--added');
+                                }, 2000);
+                            });
+                        }
+
+                        imageContainer.appendChild(addBtn);
+                        debugLog('Add button added to main image');
+                    }
+                }
+            }
+        }
+    }
+
+    // Run detail page button injection once per load; Python re-invokes
+    // it through this handle when the URL changes, which replaces the
+    // old page-lifetime MutationObserver on document.body
+    window.__zomboidAddDetailButtons = addDetailPageButtons;
+    addDetailPageButtons();
+
+    // Called from Python when the installed-mod set changes: rebuild all
+    // buttons against the new set without re-shipping this script
+    window.__zomboidRefresh = function() {
+        installedMods = window.__zomboidInstalled || new Set();
+        seen = new WeakSet();
+        document.querySelectorAll('.zomboid-queue-btn, .zomboid-main-add-btn')
+            .forEach(btn => btn.remove());
+        addButtonsToAllItems();
+        addDetailPageButtons();
+    };
+
+})();
+"""
+
+
 class WorkshopBrowserWidget(QWidget):
     """Widget for browsing Steam Workshop with injected 'Add to Queue' buttons."""
 
     # Signal emitted when user adds a mod to queue
     mod_added = Signal(str, str)  # publishedfileid, title
 
+    # Signal emitted when user adds several mods at once (detail-page
+    # required items, mod-list imports)
+    mods_added = Signal(list)  # list of (publishedfileid, title)
+
     PROJECT_ZOMBOID_WORKSHOP_URL = "https://steamcommunity.com/app/108600/workshop/"
 
     def __init__(self, parent=None):
         """Initialize the workshop browser widget."""
         super().__init__(parent)
         self.installed_mod_ids = set()
+        # Serialized installed-ID payload, rebuilt only when the set changes
+        self._installed_ids_json = None
+
+        # The browser only ever talks to the Steam workshop; a bounded
+        # in-memory HTTP cache beats the disk cache and skips its
+        # cold-start warmup. Qt's default profile is already
+        # off-the-record, so cookies stay session-only either way.
+        profile = QWebEngineProfile.defaultProfile()
+        profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.MemoryHttpCache)
+        profile.setHttpCacheMaximumSize(64 * 1024 * 1024)
+
+        # Create the view and kick off the workshop load right away so
+        # DNS/TLS/HTTP overlap the rest of widget construction
+        self.web_view = QWebEngineView(self)
+        self.page = WorkshopPage(self)
+        self.page.mod_info_received.connect(self._handle_mod_added)
+        self.page.mods_info_received.connect(self.mods_added)
+        self.web_view.setPage(self.page)
+        self.web_view.setUrl(QUrl(self.PROJECT_ZOMBOID_WORKSHOP_URL))
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -56,20 +493,16 @@ class WorkshopBrowserWidget(QWidget):
 
         layout.addLayout(nav_layout)
 
-        # Create web view
-        self.web_view = QWebEngineView()
-
-        # Create custom page to intercept JavaScript messages
-        self.page = WorkshopPage(self)
-        self.page.mod_info_received.connect(self._handle_mod_added)
-        self.web_view.setPage(self.page)
-
-        # Update URL bar when page loads
+        # Adopt the web view created (and already loading) in __init__
         self.web_view.urlChanged.connect(self._on_url_changed)
 
-        # Load Project Zomboid Workshop
-        self.web_view.setUrl(QUrl(self.PROJECT_ZOMBOID_WORKSHOP_URL))
-
+        # Detail-page buttons are re-injected on navigation rather than
+        # by a mutation observer that fires for the page's whole lifetime
+        self.web_view.urlChanged.connect(
+            lambda _url: self.page.runJavaScript(
+                "window.__zomboidAddDetailButtons && window.__zomboidAddDetailButtons();"
+            )
+        )
         layout.addWidget(self.web_view)
         self.setLayout(layout)
 
@@ -86,7 +519,11 @@ class WorkshopBrowserWidget(QWidget):
     @Slot(QUrl)
     def _on_url_changed(self, url: QUrl):
         """Update URL bar when page URL changes."""
-        self.url_bar.setText(url.toString())
+        # urlChanged fires for redirects too; only touch the widget when
+        # the text actually differs
+        new_text = url.toString()
+        if new_text != self.url_bar.text():
+            self.url_bar.setText(new_text)
 
     @Slot(str, str)
     def _handle_mod_added(self, publishedfileid: str, title: str):
@@ -114,8 +551,13 @@ class WorkshopBrowserWidget(QWidget):
         Args:
             installed_mod_ids: Set of installed Workshop IDs
         """
-        self.installed_mod_ids = installed_mod_ids
-        self.page._inject_button_script()
+        new_ids = frozenset(installed_mod_ids)
+        if new_ids == self.installed_mod_ids:
+            # Nothing changed; skip re-serializing and re-shipping the set
+            return
+        self.installed_mod_ids = new_ids
+        self._installed_ids_json = None
+        self.page.update_installed_mods()
 
     def _import_mod_list(self):
         """Import a mod list from JSON file and add mods to download queue."""
@@ -130,9 +572,10 @@ class WorkshopBrowserWidget(QWidget):
         if not file_path:
             return
 
-        # Read and parse JSON file
+        # Read and parse JSON file. Binary mode lets the parser decode
+        # UTF-8 itself instead of going through a transient str
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 mod_list_data = json.load(f)
         except Exception as e:
             QMessageBox.critical(
@@ -161,24 +604,26 @@ class WorkshopBrowserWidget(QWidget):
             )
             return
 
-        # Filter out mods that are already installed (silent skip)
+        # Filter out duplicates and mods that are already installed
+        # (silent skip). Single pass with the hot names bound to locals;
+        # large modpacks make the per-entry attribute lookups measurable.
+        installed = self.installed_mod_ids
         mods_to_add = []
+        append = mods_to_add.append
+        seen = set()
         skipped_count = 0
 
         for mod in mods:
             if not isinstance(mod, dict):
                 continue
-
             workshop_id = mod.get("workshop_id")
-            if not workshop_id:
+            if not workshop_id or workshop_id in seen:
                 continue
-
-            # Skip if already installed
-            if workshop_id in self.installed_mod_ids:
+            seen.add(workshop_id)
+            if workshop_id in installed:
                 skipped_count += 1
-                continue
-
-            mods_to_add.append(mod)
+            else:
+                append(mod)
 
         # Check if we have any mods to add
         if not mods_to_add:
@@ -213,15 +658,13 @@ class WorkshopBrowserWidget(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Add all mods to queue
-        added_count = 0
-        for mod in mods_to_add:
-            workshop_id = mod.get("workshop_id")
-            mod_name = mod.get("name", "Unknown Mod")
-
-            # Emit signal to add mod to queue
-            self.mod_added.emit(workshop_id, mod_name)
-            added_count += 1
+        # Add all mods to the queue as one batch: one signal, one DB
+        # transaction and one model insert downstream
+        self.mods_added.emit(
+            [(mod.get("workshop_id"), mod.get("name", "Unknown Mod"))
+             for mod in mods_to_add]
+        )
+        added_count = len(mods_to_add)
 
         # Show success message
         QMessageBox.information(
@@ -231,439 +674,119 @@ class WorkshopBrowserWidget(QWidget):
         )
 
 
+class ModBridge(QObject):
+    """QWebChannel endpoint the injected script calls to queue mods."""
+
+    # Signal emitted when a mod is added from JavaScript
+    mod_added = Signal(str, str)  # publishedfileid, title
+
+    # Signal emitted when several mods arrive at once
+    mods_added = Signal(list)  # list of (publishedfileid, title)
+
+    @Slot(str, str)
+    def addMod(self, publishedfileid: str, title: str):
+        """Receive a single mod from the page and re-emit it Qt-side."""
+        self.mod_added.emit(publishedfileid, title)
+
+    @Slot(str)
+    def addModBatch(self, payload: str):
+        """Receive a JSON array of ``{id, title}`` mods in one round-trip."""
+        self.mods_added.emit(
+            [(mod["id"], mod["title"]) for mod in json.loads(payload)]
+        )
+
+
 class WorkshopPage(QWebEnginePage):
     """Custom web page that injects JavaScript for mod selection."""
 
     # Signal emitted when mod info is received from JavaScript
     mod_info_received = Signal(str, str)  # publishedfileid, title
 
+    # Signal emitted for a whole batch of mods at once
+    mods_info_received = Signal(list)  # list of (publishedfileid, title)
+
     def __init__(self, parent=None):
         """Initialize custom page."""
         super().__init__(parent)
         self.parent_widget = parent
-        self.loadFinished.connect(self._on_load_finished)
-
-    def _on_load_finished(self, success: bool):
-        """
-        Inject JavaScript when page loads.
 
-        Args:
-            success: Whether page loaded successfully
-        """
-        if success:
-            self._inject_button_script()
-
-    def _inject_button_script(self):
-        """Inject JavaScript to add 'Add to Queue' buttons to mod thumbnails."""
-        # Get installed mod IDs from parent
-        installed_ids = list(self.parent_widget.installed_mod_ids) if self.parent_widget else []
-        installed_ids_json = str(installed_ids).replace("'", '"')
-
-        js_code = f"""
-        (function() {{
-            console.log('Zomboid Mod Downloader: Injecting buttons...');
-
-            // List of installed mod IDs
-            const installedMods = new Set({installed_ids_json});
-
-            // Function to add 'Add to Queue' button to a mod item
-            function addQueueButton(workshopItem) {{
-                // Skip if button already exists
-                if (workshopItem.querySelector('.zomboid-queue-btn')) {{
-                    return;
-                }}
-
-                // Skip required items section - don't add buttons there
-                if (workshopItem.closest('.requiredItemsContainer') ||
-                    workshopItem.closest('.requiredItems') ||
-                    workshopItem.closest('#RequiredItems')) {{
-                    console.log('Skipping required item');
-                    return;
-                }}
-
-                // Get mod information from multiple possible locations
-                let link = workshopItem.querySelector('a');
-                if (!link) {{
-                    console.log('No link found in workshop item');
-                    return;
-                }}
-
-                const url = link.href;
-                const match = url.match(/[?&]id=(\\d+)/);
-                if (!match) {{
-                    console.log('No ID found in URL:', url);
-                    return;
-                }}
-
-                const publishedfileid = match[1];
-
-                // Try multiple selectors for title
-                let title = 'Unknown Mod';
-                const titleElement = workshopItem.querySelector('.workshopItemTitle') ||
-                                   workshopItem.querySelector('.workshop_item_title') ||
-                                   workshopItem.querySelector('div[class*="title"]');
-                if (titleElement) {{
-                    title = titleElement.textContent.trim();
-                }}
-
-                console.log('Found mod:', publishedfileid, title);
-
-                // Check if mod is already installed
-                const isInstalled = installedMods.has(publishedfileid);
-
-                // Create button container
-                const buttonContainer = document.createElement('div');
-                buttonContainer.className = 'zomboid-queue-btn';
-
-                if (isInstalled) {{
-                    // Installed mod styling
-                    buttonContainer.style.cssText = `
-                        position: absolute;
-                        top: 8px;
-                        right: 8px;
-                        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-                        color: white;
-                        padding: 6px 12px;
-                        text-align: center;
-                        cursor: default;
-                        border-radius: 3px;
-                        font-weight: bold;
-                        font-size: 11px;
-                        z-index: 1000;
-                        opacity: 0.8;
-                        box-shadow: 0 2px 6px rgba(0,0,0,0.3);
-                        user-select: none;
-                    `;
-                    buttonContainer.textContent = 'Installed';
-                }} else {{
-                    // Not installed styling
-                    buttonContainer.style.cssText = `
-                        position: absolute;
-                        top: 8px;
-                        right: 8px;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        padding: 6px 12px;
-                        text-align: center;
-                        cursor: pointer;
-                        border-radius: 3px;
-                        font-weight: bold;
-                        font-size: 11px;
-                        z-index: 1000;
-                        opacity: 0.9;
-                        transition: all 0.2s ease;
-                        box-shadow: 0 2px 6px rgba(0,0,0,0.3);
-                        user-select: none;
-                    `;
-                    buttonContainer.textContent = 'Add';
-                }}
-
-                // Only add interactions for non-installed mods
-                if (!isInstalled) {{
-                    // Hover effects
-                    buttonContainer.addEventListener('mouseover', function() {{
-                        this.style.opacity = '1';
-                        this.style.transform = 'scale(1.05)';
-                        this.style.boxShadow = '0 3px 8px rgba(0,0,0,0.4)';
-                    }});
-
-                    buttonContainer.addEventListener('mouseout', function() {{
-                        this.style.opacity = '0.9';
-                        this.style.transform = 'scale(1)';
-                        this.style.boxShadow = '0 2px 6px rgba(0,0,0,0.3)';
-                    }});
-
-                    // Click handler
-                    buttonContainer.addEventListener('click', function(e) {{
-                        e.preventDefault();
-                        e.stopPropagation();
-
-                        // Change button appearance
-                        this.textContent = '✓';
-                        this.style.background = 'linear-gradient(135deg, #56ab2f 0%, #a8e063 100%)';
-
-                        // Send message via console (will be captured by Qt)
-                        console.log('ZOMBOID_ADD_MOD:' + publishedfileid + '|' + title);
-
-                        // Reset button after delay
-                        setTimeout(() => {{
-                            this.textContent = 'Add';
-                            this.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-                        }}, 2000);
-                    }});
-                }}
-
-                // Make parent position relative for absolute positioning
-                workshopItem.style.position = 'relative';
-                workshopItem.appendChild(buttonContainer);
-            }}
-
-            // Add buttons to all workshop items (excluding required items and detail pages)
-            function addButtonsToAllItems() {{
-                // Don't add buttons on detail pages (only in browse/search listings)
-                if (window.location.href.includes('?id=')) {{
-                    console.log('On detail page, skipping thumbnail button injection');
-                    return;
-                }}
-
-                // Try multiple selectors
-                const selectors = [
-                    '.workshopItem',
-                    '.workshop_item',
-                    'div[class*="workshopItem"]',
-                    'div[id*="sharedfile"]'
-                ];
-
-                let itemsFound = 0;
-                selectors.forEach(selector => {{
-                    const items = document.querySelectorAll(selector);
-                    if (items.length > 0) {{
-                        console.log('Found', items.length, 'items with selector:', selector);
-                        // Filter out items that are inside required items containers
-                        const filteredItems = Array.from(items).filter(item => {{
-                            // Check if inside required items section
-                            const isInRequiredItems = item.closest('.requiredItemsContainer') ||
-                                                     item.closest('.requiredItems') ||
-                                                     item.closest('#RequiredItems') ||
-                                                     item.closest('[class*="requiredItem"]') ||
-                                                     item.closest('[class*="RequiredItem"]') ||
-                                                     item.closest('[id*="RequiredItems"]') ||
-                                                     item.closest('[id*="requiredItems"]');
-
-                            // Also check if the item itself has required in its class/id
-                            const hasRequiredInSelf = item.className.toLowerCase().includes('required') ||
-                                                     item.id.toLowerCase().includes('required');
-
-                            return !isInRequiredItems && !hasRequiredInSelf;
-                        }});
-                        console.log('After filtering required items:', filteredItems.length, 'items');
-                        filteredItems.forEach(addQueueButton);
-                        itemsFound += filteredItems.length;
-                    }}
-                }});
-
-                if (itemsFound === 0) {{
-                    console.log('No workshop items found. Retrying in 1 second...');
-                    setTimeout(addButtonsToAllItems, 1000);
-                }}
-            }}
-
-            // Wait a bit for the page to load content, then inject
-            setTimeout(addButtonsToAllItems, 500);
-            setTimeout(addButtonsToAllItems, 2000);
-
-            // Watch for new items (pagination, infinite scroll)
-            const observer = new MutationObserver(function(mutations) {{
-                addButtonsToAllItems();
-            }});
-
-            // Observe the body for changes
-            setTimeout(() => {{
-                const container = document.querySelector('#workshopBrowseItems') ||
-                                document.querySelector('#workshop_browse_items') ||
-                                document.body;
-                observer.observe(container, {{
-                    childList: true,
-                    subtree: true
-                }});
-                console.log('Observing container for changes');
-            }}, 1000);
-
-            // Add "Add to Download Queue" button on main image (top-right corner)
-            function addDetailPageButtons() {{
-                // Only run on item detail pages
-                if (window.location.href.includes('?id=')) {{
-                    // Get current item ID from URL
-                    const urlMatch = window.location.href.match(/[?&]id=(\\d+)/);
-                    if (urlMatch) {{
-                        const itemId = urlMatch[1];
-                        const isInstalled = installedMods.has(itemId);
-
-                        // Get title from page
-                        const titleElem = document.querySelector('.workshopItemTitle');
-                        const title = titleElem ? titleElem.textContent.trim() : 'Workshop Item';
-
-                        // Add button on main image (top-right corner)
-                        if (!document.querySelector('.zomboid-main-add-btn')) {{
-                            const imageContainer = document.querySelector('.workshopItemPreviewImageMain') ||
-                                                  document.querySelector('.highlight_player_area');
-
-                            if (imageContainer) {{
-                                imageContainer.style.position = 'relative';
-
-                                const addBtn = document.createElement('div');
-                                addBtn.className = 'zomboid-main-add-btn';
-                                addBtn.style.cssText = `
-                                    position: absolute;
-                                    top: 8px;
-                                    right: 8px;
-                                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                                    color: white;
-                                    padding: 8px 16px;
-                                    text-align: center;
-                                    cursor: pointer;
-                                    border-radius: 4px;
-                                    font-weight: bold;
-                                    font-size: 14px;
-                                    z-index: 1000;
-                                    opacity: 0.9;
-                                    transition: all 0.2s ease;
-                                    box-shadow: 0 2px 8px rgba(0,0,0,0.4);
-                                    user-select: none;
-                                `;
-
-                                if (isInstalled) {{
-                                    addBtn.textContent = '✓ Installed';
-                                    addBtn.style.background = 'linear-gradient(135deg, #4CAF50 0%, #45a049 100%)';
-                                    addBtn.style.cursor = 'default';
-                                }} else {{
-                                    addBtn.textContent = 'Add';
-
-                                    addBtn.addEventListener('mouseover', function() {{
-                                        this.style.opacity = '1';
-                                        this.style.transform = 'scale(1.05)';
-                                        this.style.boxShadow = '0 3px 10px rgba(0,0,0,0.5)';
-                                    }});
-
-                                    addBtn.addEventListener('mouseout', function() {{
-                                        this.style.opacity = '0.9';
-                                        this.style.transform = 'scale(1)';
-                                        this.style.boxShadow = '0 2px 8px rgba(0,0,0,0.4)';
-                                    }});
-
-                                    addBtn.addEventListener('click', function(e) {{
-                                        e.preventDefault();
-                                        e.stopPropagation();
-
-                                        this.textContent = '✓';
-                                        this.style.background = 'linear-gradient(135deg, #56ab2f 0%, #a8e063 100%)';
-
-                                        // Add the main mod
-                                        console.log('ZOMBOID_ADD_MOD:' + itemId + '|' + title);
-
-                                        // Find and add all required items
-                                        console.log('Searching for required items...');
-
-                                        // Use a Set to track already-processed IDs (avoid duplicates)
-                                        const processedIds = new Set();
-
-                                        // First, find all links in the required items section
-                                        const requiredSections = [
-                                            document.querySelector('.requiredItemsContainer'),
-                                            document.querySelector('.requiredItems'),
-                                            document.getElementById('RequiredItems'),
-                                            document.querySelector('[class*="equiredItem"]')
-                                        ];
-
-                                        // Remove duplicates and null values
-                                        const uniqueSections = [...new Set(requiredSections)].filter(s => s !== null);
-
-                                        let requiredCount = 0;
-                                        uniqueSections.forEach(section => {{
-                                            console.log('Found required items section:', section.className || section.id);
-
-                                            // Find all links in this section
-                                            const links = section.querySelectorAll('a[href*="?id="]');
-                                            console.log('Found ' + links.length + ' links in required section');
-
-                                            links.forEach(link => {{
-                                                const url = link.href;
-                                                const match = url.match(/[?&]id=(\\d+)/);
-                                                if (match) {{
-                                                    const reqId = match[1];
-
-                                                    // Skip if already processed
-                                                    if (processedIds.has(reqId)) {{
-                                                        console.log('Skipping duplicate required item:', reqId);
-                                                        return;
-                                                    }}
-                                                    processedIds.add(reqId);
-
-                                                    // Get title - try multiple approaches
-                                                    let reqTitle = 'Required Item';
-
-                                                    // Try getting title from link text
-                                                    if (link.textContent && link.textContent.trim()) {{
-                                                        reqTitle = link.textContent.trim();
-                                                    }} else {{
-                                                        // Try finding title in parent elements
-                                                        const parent = link.closest('.workshopItem') || link.parentElement;
-                                                        const titleElem = parent?.querySelector('.workshopItemTitle') ||
-                                                                        parent?.querySelector('.workshop_item_title') ||
-                                                                        parent?.querySelector('div[class*="title"]');
-                                                        if (titleElem) {{
-                                                            reqTitle = titleElem.textContent.trim();
-                                                        }}
-                                                    }}
-
-                                                    console.log('ZOMBOID_ADD_MOD:' + reqId + '|' + reqTitle);
-                                                    requiredCount++;
-                                                }}
-                                            }});
-                                        }});
-
-                                        if (requiredCount > 0) {{
-                                            console.log('Added ' + requiredCount + ' required items to queue');
-                                        }} else {{
-                                            console.log('No required items found');
-                                        }}
-
-                                        setTimeout(() => {{
-                                            this.textContent = 'Add';
-                                            this.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-                                        }}, 2000);
-                                    }});
-                                }}
-
-                                imageContainer.appendChild(addBtn);
-                                console.log('Add button added to main image');
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-
-            // Run detail page button injection
-            setTimeout(addDetailPageButtons, 1000);
-            setTimeout(addDetailPageButtons, 2500);
-
-            // Also observe for detail page changes
-            const detailObserver = new MutationObserver(addDetailPageButtons);
-            setTimeout(() => {{
-                detailObserver.observe(document.body, {{
-                    childList: true,
-                    subtree: true
-                }});
-            }}, 1500);
-
-        }})();
-        """
+        # Direct JS->Python channel: the injected script calls
+        # window.zomboid.addMod() instead of smuggling data through
+        # console.log strings that every log line had to be parsed for
+        self.bridge = ModBridge(self)
+        self.bridge.mod_added.connect(self.mod_info_received)
+        self.bridge.mods_added.connect(self.mods_info_received)
+        self.channel = QWebChannel(self)
+        self.channel.registerObject("zomboid", self.bridge)
+        self.setWebChannel(self.channel)
+        self._install_channel_script()
+
+        # Register the button script once on the page's script collection;
+        # Chromium then injects it on every navigation with zero further
+        # Python->JS marshaling
+        self._button_script = QWebEngineScript()
+        self._button_script.setName("zomboid_queue_buttons")
+        self._button_script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+        self._button_script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+        self._button_script.setRunsOnSubFrames(False)
+        self._button_script.setSourceCode(self._script_source("[]"))
+        self.scripts().insert(self._button_script)
+
+    def _install_channel_script(self):
+        """Register qwebchannel.js plus the bridge hookup on every load."""
+        qwebchannel_js = QFile(":/qtwebchannel/qwebchannel.js")
+        if not qwebchannel_js.open(QIODevice.OpenModeFlag.ReadOnly):
+            return
+        source = bytes(qwebchannel_js.readAll()).decode('utf-8')
+        qwebchannel_js.close()
+        source += (
+            "\nnew QWebChannel(qt.webChannelTransport, function(channel) {"
+            " window.zomboid = channel.objects.zomboid; });"
+        )
 
-        self.runJavaScript(js_code)
+        script = QWebEngineScript()
+        script.setName("zomboid_webchannel")
+        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+        script.setRunsOnSubFrames(False)
+        script.setSourceCode(source)
+        self.scripts().insert(script)
+
+    def _installed_ids_json(self) -> str:
+        """Serialize the installed mod IDs, reusing the widget's cached payload."""
+        if not self.parent_widget:
+            return "[]"
+        if self.parent_widget._installed_ids_json is None:
+            self.parent_widget._installed_ids_json = json.dumps(
+                list(self.parent_widget.installed_mod_ids)
+            )
+        return self.parent_widget._installed_ids_json
 
-    def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
+    @staticmethod
+    def _script_source(installed_ids_json: str) -> str:
         """
-        Handle JavaScript console messages and parse mod addition requests.
+        Build the full script: installed-ID prelude plus the constant body.
 
-        Args:
-            level: Message level
-            message: Console message
-            lineNumber: Line number
-            sourceID: Source file
+        The payload is passed as a string literal so V8 parses it with its
+        fast JSON parser rather than as an array literal.
         """
-        # Print all console messages for debugging
-        print(f"[JS Console] {message}")
-
-        # Check if this is a mod addition message
-        if message.startswith("ZOMBOID_ADD_MOD:"):
-            try:
-                # Parse the message: "ZOMBOID_ADD_MOD:12345|Mod Title"
-                data = message.replace("ZOMBOID_ADD_MOD:", "").strip()
-                if "|" in data:
-                    parts = data.split("|", 1)
-                    publishedfileid = parts[0].strip()
-                    title = parts[1].strip() if len(parts) > 1 else "Unknown Mod"
-                    print(f"Adding mod to queue: {publishedfileid} - {title}")
-                    self.mod_info_received.emit(publishedfileid, title)
-            except Exception as e:
-                print(f"Error parsing mod info: {e}")
+        prelude = (
+            f"window.__zomboidInstalled = new Set(JSON.parse({json.dumps(installed_ids_json)}));\n"
+        )
+        return prelude + _JS_TEMPLATE
+
+    def update_installed_mods(self):
+        """Push the current installed-mod set to the page and future loads."""
+        ids_json = self._installed_ids_json()
+
+        # Future navigations: re-bake the registered script's prelude
+        self.scripts().remove(self._button_script)
+        self._button_script.setSourceCode(self._script_source(ids_json))
+        self.scripts().insert(self._button_script)
+
+        # Current page: update the set in place and refresh the buttons
+        # without re-shipping the script body
+        self.runJavaScript(
+            f"window.__zomboidInstalled = new Set(JSON.parse({json.dumps(ids_json)}));"
+            " window.__zomboidRefresh && window.__zomboidRefresh();"
+        )
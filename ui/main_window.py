@@ -1,13 +1,16 @@
 """
 Main window for Zomboid Mod Downloader application.
 """
+import logging
+from functools import partial
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QListWidget, QListWidgetItem, QPushButton, QLabel, QMenuBar,
+    QListView, QPushButton, QLabel, QMenuBar,
     QMenu, QMessageBox, QFileDialog, QDialog, QFormLayout, QLineEdit,
     QCheckBox, QDialogButtonBox, QTabWidget
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, Slot
 from PySide6.QtGui import QAction
 
 from ui.browser_widget import WorkshopBrowserWidget
@@ -17,6 +20,94 @@ from core.steamcmd import SteamCMDWrapper
 from core.database import ModDatabase
 from core.settings import Settings
 
+logger = logging.getLogger(__name__)
+
+
+class QueueModel(QAbstractListModel):
+    """
+    List model backing the download queue.
+
+    Rows are plain (publishedfileid, title) tuples with a dict index for
+    O(1) membership and title lookups; the view virtualizes rendering,
+    so no per-item QObject is ever allocated.
+    """
+
+    TitleRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        """Initialize an empty queue model."""
+        super().__init__(parent)
+        self._rows: list[tuple[str, str]] = []
+        self._index: dict[str, int] = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of queued mods."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return display text, the workshop ID, or the title for a row."""
+        if not index.isValid():
+            return None
+        publishedfileid, title = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{title}\nID: {publishedfileid}"
+        if role == Qt.UserRole:
+            return publishedfileid
+        if role == self.TitleRole:
+            return title
+        return None
+
+    def contains(self, publishedfileid: str) -> bool:
+        """Check whether a mod is already queued."""
+        return publishedfileid in self._index
+
+    def title_for(self, publishedfileid: str) -> str:
+        """Return the queued title for a mod, or None if not queued."""
+        row = self._index.get(publishedfileid)
+        return self._rows[row][1] if row is not None else None
+
+    def ids(self) -> list:
+        """Return the queued workshop IDs in queue order."""
+        return [publishedfileid for publishedfileid, _title in self._rows]
+
+    def add(self, publishedfileid: str, title: str):
+        """Append one mod to the queue."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append((publishedfileid, title))
+        self._index[publishedfileid] = row
+        self.endInsertRows()
+
+    def extend(self, rows: list):
+        """Append many (publishedfileid, title) rows in one insert."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for offset, (publishedfileid, title) in enumerate(rows):
+            self._rows.append((publishedfileid, title))
+            self._index[publishedfileid] = first + offset
+        self.endInsertRows()
+
+    def remove_many(self, publishedfileids: list):
+        """Remove the given mods from the queue."""
+        rows = sorted(
+            (self._index[pfid] for pfid in publishedfileids if pfid in self._index),
+            reverse=True
+        )
+        for row in rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+        self._index = {pfid: i for i, (pfid, _t) in enumerate(self._rows)}
+
+    def clear(self):
+        """Remove every queued mod."""
+        self.beginResetModel()
+        self._rows.clear()
+        self._index.clear()
+        self.endResetModel()
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -30,6 +121,20 @@ class MainWindow(QMainWindow):
         self.settings = Settings()
         self.database = ModDatabase()
         self.steamcmd: SteamCMDWrapper = None
+        self._settings_dialog: SettingsDialog = None
+
+        # True while a SteamCMD run is in flight; keeps the download
+        # button disabled even as queue edits update the count label
+        self._download_active = False
+
+        # Last installed-ID set pushed to the workshop browser
+        self._last_installed_ids: frozenset = frozenset()
+
+        # Coalesce bursts of mods-changed notifications into one refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_mods_changed)
 
         # Setup UI
         width, height = self.settings.get_window_size()
@@ -81,6 +186,7 @@ class MainWindow(QMainWindow):
         # Left side: Workshop browser
         self.browser = WorkshopBrowserWidget()
         self.browser.mod_added.connect(self._on_mod_added)
+        self.browser.mods_added.connect(self._on_mods_added)
         splitter.addWidget(self.browser)
 
         # Right side: Download queue
@@ -108,8 +214,12 @@ class MainWindow(QMainWindow):
         header_label.setStyleSheet("font-size: 14pt; font-weight: bold;")
         layout.addWidget(header_label)
 
-        # Queue list
-        self.queue_list = QListWidget()
+        # Queue list: a view over QueueModel, which keeps the rows as
+        # plain tuples instead of one QListWidgetItem QObject per mod
+        self.queue_model = QueueModel(self)
+        self.queue_list = QListView()
+        self.queue_list.setModel(self.queue_model)
+        self.queue_list.setUniformItemSizes(True)
         layout.addWidget(self.queue_list)
 
         # Queue info label
@@ -120,17 +230,9 @@ class MainWindow(QMainWindow):
         button_layout = QVBoxLayout()
 
         self.download_button = QPushButton("Download Mods")
-        self.download_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 12px;
-                font-size: 12pt;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        # Styled by the QPushButton#downloadPrimary rules in the
+        # application stylesheet, which Qt parses once at startup
+        self.download_button.setObjectName("downloadPrimary")
         self.download_button.clicked.connect(self._start_download)
         button_layout.addWidget(self.download_button)
 
@@ -192,27 +294,48 @@ class MainWindow(QMainWindow):
             title: Mod title
         """
         # Check if already in queue
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            if item.data(Qt.UserRole) == publishedfileid:
-                QMessageBox.information(self, "Already in Queue", f"'{title}' is already in the download queue.")
-                return
+        if self.queue_model.contains(publishedfileid):
+            QMessageBox.information(self, "Already in Queue", f"'{title}' is already in the download queue.")
+            return
 
         # Add to database
         self.database.add_to_queue(publishedfileid, title)
 
         # Add to UI list
-        item = QListWidgetItem(f"{title}\nID: {publishedfileid}")
-        item.setData(Qt.UserRole, publishedfileid)
-        self.queue_list.addItem(item)
+        self.queue_model.add(publishedfileid, title)
+
+        self._update_queue_info()
+
+    @Slot(list)
+    def _on_mods_added(self, mods: list):
+        """
+        Handle a batch of mods added at once from the browser.
+
+        Args:
+            mods: List of (publishedfileid, title) tuples
+        """
+        # Drop entries already queued (or duplicated within the batch)
+        new_rows = []
+        batch_seen = set()
+        for publishedfileid, title in mods:
+            if publishedfileid in batch_seen or self.queue_model.contains(publishedfileid):
+                continue
+            batch_seen.add(publishedfileid)
+            new_rows.append((publishedfileid, title))
+
+        if not new_rows:
+            return
 
+        # One DB transaction and one model insert for the whole batch
+        self.database.add_to_queue_bulk(new_rows)
+        self.queue_model.extend(new_rows)
         self._update_queue_info()
 
     def _update_queue_info(self):
         """Update queue information label."""
-        count = self.queue_list.count()
+        count = self.queue_model.rowCount()
         self.queue_info_label.setText(f"{count} mod{'s' if count != 1 else ''} in queue")
-        self.download_button.setEnabled(count > 0)
+        self.download_button.setEnabled(count > 0 and not self._download_active)
 
     def _clear_queue(self):
         """Clear all items from the queue."""
@@ -226,25 +349,29 @@ class MainWindow(QMainWindow):
 
         if reply == QMessageBox.Yes:
             self.database.clear_queue()
-            self.queue_list.clear()
+            self.queue_model.clear()
             self._update_queue_info()
 
     def _remove_selected(self):
         """Remove selected items from the queue."""
-        selected_items = self.queue_list.selectedItems()
-        if not selected_items:
+        selected = self.queue_list.selectionModel().selectedRows()
+        if not selected:
             return
 
-        for item in selected_items:
-            publishedfileid = item.data(Qt.UserRole)
-            self.database.remove_from_queue(publishedfileid)
-            row = self.queue_list.row(item)
-            self.queue_list.takeItem(row)
+        # One DB transaction for the whole selection
+        removed_ids = [index.data(Qt.UserRole) for index in selected]
+        self.database.remove_from_queue_bulk(removed_ids)
+        self.queue_model.remove_many(removed_ids)
 
         self._update_queue_info()
 
     def _start_download(self):
         """Start downloading mods from the queue."""
+        # The dialog is non-modal, so a second run could otherwise be
+        # started while the first is still writing to disk
+        if self._download_active:
+            return
+
         # Check if SteamCMD is configured
         if not self.settings.steamcmd_path or not self.settings.mod_download_path:
             QMessageBox.warning(
@@ -256,14 +383,15 @@ class MainWindow(QMainWindow):
             return
 
         # Get all mods from queue
-        publishedfileids = []
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            publishedfileids.append(item.data(Qt.UserRole))
+        publishedfileids = self.queue_model.ids()
 
         if not publishedfileids:
             return
 
+        # Collect processed mods here and write them in one transaction
+        # when the download finishes (avoids one commit per mod)
+        self._pending_downloaded = []
+
         # Create SteamCMD wrapper
         self.steamcmd = SteamCMDWrapper(
             self.settings.steamcmd_path,
@@ -273,16 +401,27 @@ class MainWindow(QMainWindow):
         # Create progress dialog
         progress = ProgressDialog(self)
 
-        # Connect signals
-        self.steamcmd.output_received.connect(progress.append_output)
+        # Connect signals. Queued connections keep the post-processing
+        # worker thread from ever blocking on a UI slot, and partial
+        # avoids a Python lambda on the dispatch path
+        self.steamcmd.output_received.connect(
+            progress.append_output, Qt.QueuedConnection
+        )
         self.steamcmd.download_started.connect(progress.download_started)
         self.steamcmd.download_finished.connect(
-            lambda success, msg: self._on_download_finished(progress, success, msg)
+            partial(self._on_download_finished, progress), Qt.QueuedConnection
+        )
+        self.steamcmd.mod_processed.connect(
+            self._on_mod_processed, Qt.QueuedConnection
         )
-        self.steamcmd.mod_processed.connect(self._on_mod_processed)
         progress.cancel_button.clicked.connect(self.steamcmd.cancel_download)
 
-        # Start download
+        # Start download. SteamCMD already runs asynchronously through
+        # QProcess signals, so showing the dialog non-modally keeps the
+        # whole main window usable while it works; the active flag keeps
+        # _update_queue_info from re-enabling the button mid-run
+        self._download_active = True
+        self.download_button.setEnabled(False)
         username = self.settings.steam_username if not self.settings.use_anonymous_login else ""
         self.steamcmd.download_mods(
             publishedfileids,
@@ -290,7 +429,7 @@ class MainWindow(QMainWindow):
             use_anonymous=self.settings.use_anonymous_login
         )
 
-        progress.exec()
+        progress.show()
 
     @Slot(str, list)
     def _on_mod_processed(self, publishedfileid: str, folder_names: list):
@@ -304,20 +443,16 @@ class MainWindow(QMainWindow):
         workshop_url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={publishedfileid}"
 
         # Get the mod title from the queue
-        title = None
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            if item.data(Qt.UserRole) == publishedfileid:
-                title = item.text().split("\n")[0]
-                break
-
+        title = self.queue_model.title_for(publishedfileid)
         if not title:
             title = f"Workshop Item {publishedfileid}"
 
-        # Save workshop URL for each folder created
+        # Save workshop URL for each folder created (flushed in bulk when
+        # the download finishes)
         for folder_name in folder_names:
-            self.database.add_downloaded_mod(folder_name, title, workshop_url=workshop_url)
-            print(f"Saved workshop URL for folder: {folder_name} -> {workshop_url}")
+            self._pending_downloaded.append((folder_name, title, 0, workshop_url))
+            # %s-style args are only formatted when DEBUG is enabled
+            logger.debug("Saved workshop URL for folder: %s -> %s", folder_name, workshop_url)
 
     def _on_download_finished(self, progress: ProgressDialog, success: bool, message: str):
         """
@@ -330,28 +465,59 @@ class MainWindow(QMainWindow):
         """
         progress.download_finished(success, message)
 
+        # Drop this run's connections so the finished wrapper can't keep
+        # dispatching into the UI and the dialog's cancel button stops
+        # holding it alive
+        self.steamcmd.output_received.disconnect()
+        self.steamcmd.download_started.disconnect()
+        self.steamcmd.download_finished.disconnect()
+        self.steamcmd.mod_processed.disconnect()
+        progress.cancel_button.clicked.disconnect(self.steamcmd.cancel_download)
+
+        # Record everything that was processed in a single transaction
+        self.database.add_downloaded_mods_bulk(self._pending_downloaded)
+        self._pending_downloaded = []
+
+        self._download_active = False
+        self._update_queue_info()
+
         if success:
             # Clear queue if auto-clear is enabled
             if self.settings.auto_clear_queue:
                 self.database.clear_queue()
-                self.queue_list.clear()
+                self.queue_model.clear()
                 self._update_queue_info()
 
-            # Refresh local mods and update workshop browser
+            # New mods appeared on disk, so schedule a refresh; the
+            # installed-set diff in _do_mods_changed keeps the browser
+            # untouched if the scan somehow finds nothing new. Plain
+            # queue clears never trigger this path
             self._on_mods_changed()
 
     def _on_mods_changed(self):
+        """Schedule a browsers refresh, coalescing rapid-fire changes."""
+        # Restarting the timer folds any burst of notifications into a
+        # single _do_mods_changed run
+        self._refresh_timer.start()
+
+    def _do_mods_changed(self):
         """Handle mods list changes (refresh browsers)."""
         # Refresh local mods browser
         self.mods_browser.refresh_mods()
 
-        # Update workshop browser with installed mod IDs
+        # Update workshop browser only when the installed set changed
         installed_ids = self.mods_browser.get_installed_mod_ids()
-        self.browser.set_installed_mods(installed_ids)
+        if installed_ids != self._last_installed_ids:
+            self._last_installed_ids = installed_ids
+            self.browser.set_installed_mods(installed_ids)
 
     def _show_settings(self):
         """Show settings dialog."""
-        dialog = SettingsDialog(self.settings, self)
+        # Build the dialog once and repopulate it on every open
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.settings, self)
+        dialog = self._settings_dialog
+        dialog.reload_fields()
         if dialog.exec() == QDialog.Accepted:
             # Update mods browser path if changed
             self.mods_browser.set_mod_path(self.settings.mod_download_path)
@@ -396,10 +562,11 @@ class MainWindow(QMainWindow):
     def _load_queue_from_database(self):
         """Load queue items from database."""
         queue_items = self.database.get_queue()
-        for item_data in queue_items:
-            item = QListWidgetItem(f"{item_data['title']}\nID: {item_data['publishedfileid']}")
-            item.setData(Qt.UserRole, item_data['publishedfileid'])
-            self.queue_list.addItem(item)
+
+        # One insert covers the whole restore
+        self.queue_model.extend(
+            [(item.publishedfileid, item.title) for item in queue_items]
+        )
 
         self._update_queue_info()
 
@@ -407,6 +574,7 @@ class MainWindow(QMainWindow):
         """Handle window close event."""
         # Save window size
         self.settings.set_window_size(self.width(), self.height())
+        self.settings.flush()
 
         # Close database
         self.database.close()
@@ -483,6 +651,15 @@ class SettingsDialog(QDialog):
 
         self.setLayout(layout)
 
+    def reload_fields(self):
+        """Re-read the current settings into the dialog fields."""
+        self.steamcmd_path_edit.setText(self.settings.steamcmd_path)
+        self.mod_path_edit.setText(self.settings.mod_download_path)
+        self.anonymous_checkbox.setChecked(self.settings.use_anonymous_login)
+        self.username_edit.setText(self.settings.steam_username)
+        self.username_edit.setEnabled(not self.settings.use_anonymous_login)
+        self.auto_clear_checkbox.setChecked(self.settings.auto_clear_queue)
+
     def _browse_steamcmd(self):
         """Browse for SteamCMD executable."""
         file_path, _ = QFileDialog.getOpenFileName(
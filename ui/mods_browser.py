@@ -4,14 +4,90 @@ Local mods browser widget for managing installed mods.
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
     QPushButton, QLabel, QMessageBox, QHeaderView, QMenu, QSplitter,
-    QListWidget, QListWidgetItem, QTextEdit, QFrame, QFileDialog
+    QListView, QTextEdit, QFrame, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal, QUrl
-from PySide6.QtGui import QDesktopServices, QAction, QPixmap
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QRunnable, QThreadPool, QTimer, QUrl,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QDesktopServices, QAction, QImage, QPixmap
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
+import re
 import shutil
 import json
 
+# Workshop item ID embedded in a Steam Workshop URL, e.g.
+# https://steamcommunity.com/sharedfiles/filedetails/?id=12345678
+_WORKSHOP_ID_RE = re.compile(r'[?&]id=(\d+)')
+
+# Scaled poster thumbnails persisted across restarts, keyed by a hash
+# of (path, mtime, target size) so a changed poster misses naturally
+_POSTER_DISK_CACHE = Path.home() / '.cache' / 'zomboid-mod-downloader' / 'posters'
+_POSTER_DISK_CACHE_LIMIT = 100 * 1024 * 1024  # bytes
+
+
+def _poster_cache_file(key: tuple) -> Path:
+    """Map an in-memory poster cache key to its on-disk file."""
+    digest = hashlib.sha1('|'.join(str(part) for part in key).encode()).hexdigest()
+    return _POSTER_DISK_CACHE / f"{digest}.png"
+
+
+def _prune_poster_cache():
+    """Drop the oldest thumbnails once the cache dir exceeds its cap."""
+    try:
+        with os.scandir(_POSTER_DISK_CACHE) as entries:
+            files = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in entries if e.is_file()]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in files)
+    if total <= _POSTER_DISK_CACHE_LIMIT:
+        return
+    for mtime, size, file_path in sorted(files):
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total -= size
+        if total <= _POSTER_DISK_CACHE_LIMIT:
+            break
+
+
+class ModsListModel(QAbstractListModel):
+    """
+    List model over the installed mod folders.
+
+    Rows live in a plain Python list and the view only materializes
+    what is visible, instead of one QListWidgetItem per mod.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (display name, folder Path) per mod
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        name, folder = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == Qt.ItemDataRole.UserRole:
+            return folder
+        return None
+
+    def set_rows(self, rows: list):
+        """Replace the whole collection in one model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
 
 class ModsBrowser(QWidget):
     """Widget for browsing and managing local mods."""
@@ -19,6 +95,9 @@ class ModsBrowser(QWidget):
     # Signal emitted when mods list changes
     mods_changed = Signal()
 
+    # Ready-to-show poster pixmaps kept per (path, mtime, size)
+    POSTER_CACHE_SIZE = 64
+
     def __init__(self, mod_path: str, database=None, parent=None):
         """
         Initialize the mods browser.
@@ -32,6 +111,25 @@ class ModsBrowser(QWidget):
         self.mod_path = Path(mod_path) if mod_path else None
         self.database = database
         self.current_mod_folder = None
+        self._pending_folder = None
+        self._changed_pending = False
+        self._workshop_url_cache = {}
+        # Folder sizes are warmed in the background after a refresh so
+        # selections usually find the walk already done
+        self._size_executor = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix='mod-size'
+        )
+        self._size_futures = {}
+        self._poster_cache = {}
+        self._size_cache = {}
+        self._modinfo_cache = {}
+
+        # Posters decode on the global thread pool; the request counter
+        # lets the result slot drop loads for superseded selections
+        self._poster_req = 0
+        self._poster_signals = _PosterSignals()
+        self._poster_signals.loaded.connect(self._on_poster_loaded)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -167,8 +265,12 @@ class ModsBrowser(QWidget):
         layout.addLayout(header_layout)
 
         # Mods list
-        self.mods_list = QListWidget()
-        self.mods_list.itemSelectionChanged.connect(self._on_mod_selected)
+        self.mods_model = ModsListModel(self)
+        self.mods_list = QListView()
+        self.mods_list.setModel(self.mods_model)
+        # All rows are one line of text; skip per-row height measurement
+        self.mods_list.setUniformItemSizes(True)
+        self.mods_list.selectionModel().selectionChanged.connect(self._on_mod_selected)
         self.mods_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.mods_list.customContextMenuRequested.connect(self._show_context_menu)
         layout.addWidget(self.mods_list)
@@ -191,57 +293,71 @@ class ModsBrowser(QWidget):
         self.mod_path = Path(mod_path) if mod_path else None
         self.refresh_mods()
 
+    def _list_mod_folders(self) -> list:
+        """
+        List mod folders under the mod path.
+
+        os.scandir answers the directory check from the cached dirent
+        type, where iterdir + is_dir() paid a stat call per entry.
+
+        Returns:
+            List of folder Paths
+        """
+        with os.scandir(self.mod_path) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and not entry.name.startswith('.')
+            ]
+
     def refresh_mods(self):
         """Refresh the mods list."""
-        self.mods_list.clear()
         self.current_mod_folder = None
+        self._workshop_url_cache.clear()
         self._clear_details()
 
         if not self.mod_path or not self.mod_path.exists():
+            self.mods_model.set_rows([])
             self.info_label.setText("Mod path not set or doesn't exist. Set it in Settings.")
             self.mod_count_label.setText("Active [0]")
             return
 
         # Find all mod folders
-        mod_folders = [f for f in self.mod_path.iterdir() if f.is_dir() and not f.name.startswith('.')]
+        mod_folders = self._list_mod_folders()
 
         self.mod_count_label.setText(f"Active [{len(mod_folders)}]")
 
         if len(mod_folders) == 0:
+            self.mods_model.set_rows([])
             self.info_label.setText("No mods found in the mods directory")
             return
 
         self.info_label.setText("")
 
-        # Populate list
-        for folder in sorted(mod_folders, key=lambda x: x.name.lower()):
-            self._add_mod_to_list(folder)
-
-    def _add_mod_to_list(self, mod_folder: Path):
-        """
-        Add a mod to the list.
-
-        Args:
-            mod_folder: Path to the mod folder
-        """
-        # Try to find mod name from mod.info or use folder name
-        mod_name = self._get_mod_name(mod_folder)
-
-        # Create list item
-        item = QListWidgetItem(mod_name)
-        item.setData(Qt.ItemDataRole.UserRole, str(mod_folder))
-        self.mods_list.addItem(item)
+        # One model reset covers the whole batch, so the view relayouts
+        # once. The Path object itself rides along as row data, so the
+        # selection and context handlers read it back without
+        # rebuilding one from a string
+        self.mods_model.set_rows([
+            (self._get_mod_name(folder), folder)
+            for folder in sorted(mod_folders, key=lambda x: x.name.lower())
+        ])
+
+        # Kick off the size walks now; stat latency overlaps across
+        # folders instead of being paid serially per selection
+        self._size_futures = {
+            folder: self._size_executor.submit(self._get_folder_size, folder)
+            for folder in mod_folders
+        }
 
     def _on_mod_selected(self):
         """Handle mod selection change."""
-        selected_items = self.mods_list.selectedItems()
-        if not selected_items:
+        selected = self.mods_list.selectionModel().selectedIndexes()
+        if not selected:
             self._clear_details()
             return
 
-        item = selected_items[0]
-        mod_folder_path = item.data(Qt.ItemDataRole.UserRole)
-        self.current_mod_folder = Path(mod_folder_path)
+        self.current_mod_folder = selected[0].data(Qt.ItemDataRole.UserRole)
 
         self._update_details(self.current_mod_folder)
 
@@ -266,102 +382,102 @@ class ModsBrowser(QWidget):
         mod_name = self._get_mod_name(mod_folder)
         self.detail_name_label.setText(mod_name)
 
-        # Load and display poster/thumbnail if it exists
+        # Enable buttons
+        self.open_folder_btn.setEnabled(True)
+        self.delete_btn.setEnabled(True)
+
+        # The rest of the panel (poster decode, folder size, database
+        # lookups) is the expensive part of a selection. Defer it for a
+        # moment so that scrolling through the list with the keyboard
+        # only pays for the folder the user actually lands on
+        self._pending_folder = mod_folder
+        QTimer.singleShot(20, self._deferred_update_details)
+
+    def _deferred_update_details(self):
+        """Fill in the expensive parts of the details panel."""
+        mod_folder = self._pending_folder
+        if mod_folder is None or mod_folder is not self.current_mod_folder:
+            # Selection moved on before the timer fired
+            return
+
+        # Load and display poster/thumbnail if it exists. Decoding and
+        # smooth-scaling the PNG is the expensive part of a selection,
+        # so cached results show immediately and misses decode on a
+        # worker thread while the UI stays responsive
         poster_path = mod_folder / "poster.png"
+        self._poster_req += 1
         if poster_path.exists():
-            pixmap = QPixmap(str(poster_path))
-            if not pixmap.isNull():
-                # Scale to fit while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    self.poster_label.width() - 10,
-                    self.poster_label.maximumHeight() - 10,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.poster_label.setPixmap(scaled_pixmap)
+            target_width = self.poster_label.width() - 10
+            target_height = self.poster_label.maximumHeight() - 10
+            key = (
+                str(poster_path), poster_path.stat().st_mtime_ns,
+                target_width, target_height
+            )
+            cached = self._poster_cache.get(key)
+            if cached is not None:
+                self.poster_label.setPixmap(cached)
             else:
                 self.poster_label.clear()
-                self.poster_label.setText("No poster available")
+                self.poster_label.setText("Loading...")
+                QThreadPool.globalInstance().start(_PosterLoader(
+                    self._poster_req, key, str(poster_path),
+                    target_width, target_height, self._poster_signals
+                ))
         else:
             self.poster_label.clear()
             self.poster_label.setText("No poster available")
 
-        # Build info text in Steam Workshop style
-        info_parts = []
+        # Build info rows in Steam Workshop style. Rendered as plain
+        # text so QTextEdit skips its rich-text parser entirely
+        info_rows = []
 
-        # Read mod.info to extract details
-        mod_info_path = mod_folder / "mod.info"
-        mod_info_data = {}
-        if mod_info_path.exists():
-            try:
-                with open(mod_info_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        line = line.strip()
-                        if '=' in line and not line.startswith('#'):
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            if key not in mod_info_data:  # Keep first occurrence
-                                mod_info_data[key] = value
-                            elif key == 'description':  # Concatenate descriptions
-                                mod_info_data[key] += '\n' + value
-            except Exception:
-                pass
+        # Read mod.info to extract details (cached per file mtime)
+        mod_info_data = self._parse_mod_info(mod_folder)
 
         # Display in Steam Workshop style format
         if 'name' in mod_info_data:
-            info_parts.append(f"<b>Name:</b><br>{mod_info_data['name']}")
+            info_rows.append(("Name", mod_info_data['name']))
 
         if 'id' in mod_info_data:
-            info_parts.append(f"<b>PackageID:</b><br>{mod_info_data['id']}")
+            info_rows.append(("PackageID", mod_info_data['id']))
 
         # Authors
-        authors = mod_info_data.get('authors', 'Unknown')
-        info_parts.append(f"<b>Authors:</b><br>{authors}")
+        info_rows.append(("Authors", mod_info_data.get('authors', 'Unknown')))
 
         # Mod Version
-        mod_version = mod_info_data.get('modversion', 'Not specified')
-        info_parts.append(f"<b>Mod Version:</b><br>{mod_version}")
+        info_rows.append(("Mod Version", mod_info_data.get('modversion', 'Not specified')))
 
         # Supported Version
-        pz_version = mod_info_data.get('pzversion', 'Unknown')
-        info_parts.append(f"<b>Supported Version:</b><br>{pz_version}")
+        info_rows.append(("Supported Version", mod_info_data.get('pzversion', 'Unknown')))
 
         # Folder size
-        size = self._get_folder_size(mod_folder)
-        info_parts.append(f"<b>Folder Size:</b><br>{self._format_size(size)}")
+        size = self._folder_size_ready(mod_folder)
+        info_rows.append(("Folder Size", self._format_size(size)))
 
         # Path
-        info_parts.append(f"<b>Path:</b><br>{mod_folder}")
+        info_rows.append(("Path", str(mod_folder)))
 
         # Last modified
         try:
             mtime = mod_folder.stat().st_mtime
-            from datetime import datetime
             mod_time = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-            info_parts.append(f"<b>Last Touched:</b><br>{mod_time}")
+            info_rows.append(("Last Touched", mod_time))
         except Exception:
             pass
 
-        # Workshop times (if available from database)
-        if self.database and mod_folder.name:
-            workshop_url = self.database.get_mod_workshop_url(mod_folder.name)
-            if workshop_url:
-                info_parts.append(f"<b>Workshop Times:</b><br>Downloaded from Steam Workshop")
-
-        # Join with line breaks
-        self.detail_info_text.setHtml('<br><br>'.join(info_parts))
+        # Workshop times (if available from database). One lookup
+        # serves the info line, the button state and a later click on
+        # the workshop link
+        workshop_url = self._get_workshop_url(mod_folder.name)
+        if workshop_url:
+            info_rows.append(("Workshop Times", "Downloaded from Steam Workshop"))
 
-        # Enable buttons
-        self.open_folder_btn.setEnabled(True)
-        self.delete_btn.setEnabled(True)
+        # Join with blank lines between fields
+        self.detail_info_text.setPlainText(
+            '\n\n'.join(f"{label}:\n{value}" for label, value in info_rows)
+        )
 
         # Enable workshop link if we have a database-stored URL or if folder name is numeric
-        workshop_url = None
-        if self.database:
-            # Try to get URL from database (works for any folder name if we have it stored)
-            workshop_url = self.database.get_mod_workshop_url(mod_folder.name)
-
         if workshop_url:
             # We have a stored workshop URL
             self.workshop_link_btn.setEnabled(True)
@@ -372,6 +488,90 @@ class ModsBrowser(QWidget):
             # No workshop URL available
             self.workshop_link_btn.setEnabled(False)
 
+    def _get_workshop_url(self, folder_name: str):
+        """
+        Look up a folder's stored workshop URL, memoized per folder.
+
+        Args:
+            folder_name: Name of the mod folder
+
+        Returns:
+            The stored URL, or None if the database has no entry
+        """
+        if not self.database or not folder_name:
+            return None
+        if folder_name not in self._workshop_url_cache:
+            self._workshop_url_cache[folder_name] = \
+                self.database.get_mod_workshop_url(folder_name)
+        return self._workshop_url_cache[folder_name]
+
+    def _on_poster_loaded(self, request_id: int, key: tuple, image: QImage):
+        """Show a poster decoded off-thread, unless superseded."""
+        if request_id != self._poster_req:
+            return
+
+        if image.isNull():
+            self.poster_label.clear()
+            self.poster_label.setText("No poster available")
+            return
+
+        # QPixmap creation must happen on the GUI thread
+        pixmap = QPixmap.fromImage(image)
+        self._cache_poster(key, pixmap)
+        self.poster_label.setPixmap(pixmap)
+
+    def _cache_poster(self, key: tuple, pixmap):
+        """Insert a scaled poster into the cache, evicting oldest first."""
+        if len(self._poster_cache) >= self.POSTER_CACHE_SIZE:
+            self._poster_cache.pop(next(iter(self._poster_cache)))
+        self._poster_cache[key] = pixmap
+
+    def _parse_mod_info(self, mod_folder: Path) -> dict:
+        """
+        Parse a mod's mod.info file into a key/value dict.
+
+        Results are memoized on the file's mtime, so each mod.info is
+        read and parsed once until it actually changes, instead of once
+        per list population plus once per selection click.
+
+        Args:
+            mod_folder: Path to the mod folder
+
+        Returns:
+            Parsed key/value data, empty if the file is missing
+        """
+        mod_info_path = mod_folder / "mod.info"
+        try:
+            mtime = mod_info_path.stat().st_mtime_ns
+        except OSError:
+            return {}
+
+        cache_key = str(mod_info_path)
+        cached = self._modinfo_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        data = {}
+        try:
+            # mod.info files are tiny; one read plus splitlines beats
+            # per-line buffered iteration over a file handle
+            text = mod_info_path.read_text(encoding='utf-8', errors='ignore')
+            for line in text.splitlines():
+                line = line.strip()
+                if '=' in line and not line.startswith('#'):
+                    key, value = line.split('=', 1)
+                    key = key.strip()
+                    value = value.strip()
+                    if key not in data:  # Keep first occurrence
+                        data[key] = value
+                    elif key == 'description':  # Concatenate descriptions
+                        data[key] += '\n' + value
+        except Exception:
+            pass
+
+        self._modinfo_cache[cache_key] = (mtime, data)
+        return data
+
     def _get_mod_name(self, mod_folder: Path) -> str:
         """
         Get the mod name from mod.info file or use folder name.
@@ -382,36 +582,72 @@ class ModsBrowser(QWidget):
         Returns:
             Mod name
         """
-        mod_info = mod_folder / "mod.info"
-        if mod_info.exists():
-            try:
-                with open(mod_info, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        if line.strip().startswith('name='):
-                            name = line.split('=', 1)[1].strip()
-                            return name
-            except Exception:
-                pass
+        return self._parse_mod_info(mod_folder).get('name') or mod_folder.name
 
-        return mod_folder.name
+    def _folder_size_ready(self, folder: Path) -> int:
+        """
+        Get a folder's size, preferring the background warm-up result.
+
+        Args:
+            folder: Path to the folder
+
+        Returns:
+            Size in bytes
+        """
+        future = self._size_futures.pop(folder, None)
+        if future is not None:
+            # A future still queued behind other warm-up walks would
+            # make result() wait for everything ahead of it; cancel and
+            # walk this one folder directly instead
+            if not future.done() and future.cancel():
+                return self._get_folder_size(folder)
+            # Already running or finished: waits for this walk at most
+            return future.result()
+        return self._get_folder_size(folder)
 
     def _get_folder_size(self, folder: Path) -> int:
         """
         Get the total size of a folder.
 
+        Uses an iterative os.scandir walk: DirEntry serves the file-type
+        check from the directory listing and one stat per file covers
+        the size, where rglob paid extra stat calls per entry.
+
+        Results are memoized on the folder's mtime, so toggling between
+        the same mods skips the walk entirely.
+
         Args:
             folder: Path to the folder
 
         Returns:
             Size in bytes
         """
-        total = 0
         try:
-            for item in folder.rglob('*'):
-                if item.is_file():
-                    total += item.stat().st_size
-        except Exception:
-            pass
+            mtime = folder.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        cached = self._size_cache.get(str(folder))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        total = 0
+        stack = [str(folder)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+
+        self._size_cache[str(folder)] = (mtime, total)
         return total
 
     def _format_size(self, size: int) -> str:
@@ -440,10 +676,8 @@ class ModsBrowser(QWidget):
         if not self.current_mod_folder:
             return
 
-        # Try to get URL from database first (works for any folder name)
-        url = None
-        if self.database:
-            url = self.database.get_mod_workshop_url(self.current_mod_folder.name)
+        # Try to get URL from database first (memoized by the details panel)
+        url = self._get_workshop_url(self.current_mod_folder.name)
 
         # Fallback to constructed URL if folder name is numeric
         if not url and self.current_mod_folder.name.isdigit():
@@ -454,7 +688,6 @@ class ModsBrowser(QWidget):
             QDesktopServices.openUrl(QUrl(url))
         else:
             # This shouldn't happen if the button is properly disabled
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "No Workshop URL",
@@ -480,11 +713,30 @@ class ModsBrowser(QWidget):
                 mod_name = self.current_mod_folder.name
                 shutil.rmtree(self.current_mod_folder)
                 self.refresh_mods()
-                self.mods_changed.emit()
+                self._queue_mods_changed()
                 QMessageBox.information(self, "Success", f"Mod '{mod_name}' deleted successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete mod:\n{e}")
 
+    def _queue_mods_changed(self):
+        """
+        Emit mods_changed once per event loop pass.
+
+        Back-to-back deletes each schedule an emission, but subscribers
+        (the workshop browser's installed-mods refresh) hear a single
+        coalesced signal.
+        """
+        if self._changed_pending:
+            return
+        self._changed_pending = True
+        QTimer.singleShot(0, self._flush_mods_changed)
+
+    def _flush_mods_changed(self):
+        """Deliver a queued mods_changed emission."""
+        if self._changed_pending:
+            self._changed_pending = False
+            self.mods_changed.emit()
+
     def _show_context_menu(self, position):
         """
         Show context menu for mod items.
@@ -492,12 +744,11 @@ class ModsBrowser(QWidget):
         Args:
             position: Menu position
         """
-        item = self.mods_list.itemAt(position)
-        if item is None:
+        index = self.mods_list.indexAt(position)
+        if not index.isValid():
             return
 
-        mod_folder_path = item.data(Qt.ItemDataRole.UserRole)
-        mod_folder = Path(mod_folder_path)
+        mod_folder = index.data(Qt.ItemDataRole.UserRole)
 
         menu = QMenu(self)
 
@@ -542,12 +793,12 @@ class ModsBrowser(QWidget):
                 mod_name = mod_folder.name
                 shutil.rmtree(mod_folder)
                 self.refresh_mods()
-                self.mods_changed.emit()
+                self._queue_mods_changed()
                 QMessageBox.information(self, "Success", f"Mod '{mod_name}' deleted successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete mod:\n{e}")
 
-    def get_installed_mod_ids(self) -> set:
+    def get_installed_mod_ids(self) -> frozenset:
         """
         Get a set of installed mod IDs (workshop IDs).
 
@@ -556,32 +807,35 @@ class ModsBrowser(QWidget):
         2. Database records that map folder names to workshop URLs
 
         Returns:
-            Set of Workshop IDs
+            Frozen set of Workshop IDs, cheap to compare against the
+            previously pushed set
         """
         if not self.mod_path or not self.mod_path.exists():
-            return set()
+            return frozenset()
 
         mod_ids = set()
 
         # Get all installed mod folders
-        installed_folders = [f for f in self.mod_path.iterdir() if f.is_dir() and not f.name.startswith('.')]
+        installed_folders = self._list_mod_folders()
 
+        non_numeric_names = []
         for folder in installed_folders:
             # If folder name is numeric, it's a workshop ID
             if folder.name.isdigit():
                 mod_ids.add(folder.name)
-            # Otherwise, check database for workshop URL
-            elif self.database:
-                workshop_url = self.database.get_mod_workshop_url(folder.name)
-                if workshop_url:
-                    # Extract workshop ID from URL
-                    # URL format: https://steamcommunity.com/sharedfiles/filedetails/?id=12345678
-                    import re
-                    match = re.search(r'[?&]id=(\d+)', workshop_url)
-                    if match:
-                        mod_ids.add(match.group(1))
-
-        return mod_ids
+            else:
+                non_numeric_names.append(folder.name)
+
+        # Look up the remaining folders' workshop URLs in one query
+        # instead of one SELECT per folder
+        if non_numeric_names and self.database:
+            for workshop_url in self.database.get_workshop_urls(non_numeric_names).values():
+                # Extract workshop ID from URL
+                match = _WORKSHOP_ID_RE.search(workshop_url)
+                if match:
+                    mod_ids.add(match.group(1))
+
+        return frozenset(mod_ids)
 
     def _export_mod_list(self):
         """Export installed mods list to JSON file."""
@@ -594,7 +848,7 @@ class ModsBrowser(QWidget):
             return
 
         # Get all installed mods
-        installed_folders = [f for f in self.mod_path.iterdir() if f.is_dir() and not f.name.startswith('.')]
+        installed_folders = self._list_mod_folders()
 
         if not installed_folders:
             QMessageBox.information(
@@ -626,8 +880,8 @@ class ModsBrowser(QWidget):
             mods_to_export = installed_folders
         else:
             # Export only selected mods
-            selected_items = self.mods_list.selectedItems()
-            if not selected_items:
+            selected_indexes = self.mods_list.selectionModel().selectedIndexes()
+            if not selected_indexes:
                 QMessageBox.warning(
                     self,
                     "No Selection",
@@ -635,9 +889,8 @@ class ModsBrowser(QWidget):
                 )
                 return
 
-            for item in selected_items:
-                mod_folder_path = item.data(Qt.ItemDataRole.UserRole)
-                mods_to_export.append(Path(mod_folder_path))
+            for index in selected_indexes:
+                mods_to_export.append(index.data(Qt.ItemDataRole.UserRole))
 
         # Build JSON data
         mod_list_data = {
@@ -647,9 +900,15 @@ class ModsBrowser(QWidget):
         }
 
         # Add timestamp
-        from datetime import datetime
         mod_list_data["export_date"] = datetime.now().isoformat()
 
+        # Prefetch stored workshop URLs for non-numeric folders in one query
+        stored_urls = {}
+        if self.database:
+            non_numeric = [f.name for f in mods_to_export if not f.name.isdigit()]
+            if non_numeric:
+                stored_urls = self.database.get_workshop_urls(non_numeric)
+
         # Collect mod information
         for mod_folder in mods_to_export:
             mod_data = {
@@ -664,16 +923,14 @@ class ModsBrowser(QWidget):
             if mod_folder.name.isdigit():
                 mod_data["workshop_id"] = mod_folder.name
                 mod_data["workshop_url"] = f"https://steamcommunity.com/sharedfiles/filedetails/?id={mod_folder.name}"
-            # Priority 2: Check database for stored URL
-            elif self.database:
-                workshop_url = self.database.get_mod_workshop_url(mod_folder.name)
-                if workshop_url:
-                    mod_data["workshop_url"] = workshop_url
-                    # Extract ID from URL
-                    import re
-                    match = re.search(r'[?&]id=(\d+)', workshop_url)
-                    if match:
-                        mod_data["workshop_id"] = match.group(1)
+            # Priority 2: Check the prefetched stored URLs
+            elif mod_folder.name in stored_urls:
+                workshop_url = stored_urls[mod_folder.name]
+                mod_data["workshop_url"] = workshop_url
+                # Extract ID from URL
+                match = _WORKSHOP_ID_RE.search(workshop_url)
+                if match:
+                    mod_data["workshop_id"] = match.group(1)
 
             # Only add mods that have workshop information
             if mod_data["workshop_id"]:
@@ -716,3 +973,51 @@ class ModsBrowser(QWidget):
                 "Export Failed",
                 f"Failed to export mod list:\n{e}"
             )
+
+
+class _PosterSignals(QObject):
+    """Carries decoded poster images back to the GUI thread."""
+
+    loaded = Signal(int, tuple, QImage)  # request_id, cache key, image
+
+
+class _PosterLoader(QRunnable):
+    """Decodes and scales one poster image off the GUI thread."""
+
+    def __init__(self, request_id: int, key: tuple, path: str,
+                 width: int, height: int, signals: _PosterSignals):
+        """Capture the request parameters for the worker run."""
+        super().__init__()
+        self.request_id = request_id
+        self.key = key
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = signals
+
+    def run(self):
+        """Load or produce the scaled image, then post it back."""
+        # A thumbnail from a previous session is already at target
+        # size; loading it skips the full decode and smooth scale
+        cache_file = _poster_cache_file(self.key)
+        if cache_file.exists():
+            image = QImage(str(cache_file))
+            if not image.isNull():
+                self.signals.loaded.emit(self.request_id, self.key, image)
+                return
+
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.scaled(
+                self.width,
+                self.height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            try:
+                _POSTER_DISK_CACHE.mkdir(parents=True, exist_ok=True)
+                if image.save(str(cache_file), 'PNG'):
+                    _prune_poster_cache()
+            except OSError:
+                pass
+        self.signals.loaded.emit(self.request_id, self.key, image)
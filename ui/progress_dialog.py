@@ -1,11 +1,13 @@
 """
 Progress dialog for displaying download status and SteamCMD output.
 """
+from collections import deque
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QTextEdit, QPushButton,
     QLabel, QHBoxLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QTextCursor
 
 
@@ -16,22 +18,45 @@ class ProgressDialog(QDialog):
         """Initialize progress dialog."""
         super().__init__(parent)
         self.setWindowTitle("Download Progress")
-        self.setModal(True)
+        # Non-modal: the main window stays usable while SteamCMD runs
+        self.setModal(False)
         self.resize(700, 500)
+
+        # Incoming output is buffered and flushed to the text widget at
+        # most every 50ms, so a storm of SteamCMD lines costs one
+        # layout/repaint per flush instead of one per chunk
+        self._pending = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush)
+
         self.setup_ui()
 
     def setup_ui(self):
         """Setup the user interface."""
         layout = QVBoxLayout()
 
-        # Status label
+        # Status label. Outcome colours are driven by the "state"
+        # property, so changing it re-polishes against rules parsed
+        # once here instead of re-parsing a stylesheet per outcome
         self.status_label = QLabel("Initializing download...")
-        self.status_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
+        self.status_label.setStyleSheet("""
+            QLabel {
+                font-weight: bold;
+                font-size: 12pt;
+            }
+            QLabel[state="ok"] { color: green; }
+            QLabel[state="err"] { color: red; }
+            QLabel[state="cancel"] { color: orange; }
+        """)
         layout.addWidget(self.status_label)
 
-        # Output text area
+        # Output text area. Cap the document so marathon SteamCMD
+        # sessions drop their oldest lines instead of growing layout
+        # and scrolling cost without bound
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.document().setMaximumBlockCount(5000)
         self.output_text.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -92,19 +117,41 @@ class ProgressDialog(QDialog):
 
     def append_output(self, text: str):
         """
-        Append text to the output area.
+        Append text to the output area (buffered during downloads).
 
         Args:
             text: Text to append
         """
+        self._pending.append(text)
+        # Outside a download the timer is stopped; write through
+        if not self._flush_timer.isActive():
+            self._flush()
+
+    def _flush(self):
+        """Write all buffered output to the text area in one insertion."""
+        if not self._pending:
+            return
+        text = ''.join(self._pending)
+        self._pending.clear()
+
         cursor = self.output_text.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         self.output_text.setTextCursor(cursor)
         self.output_text.insertPlainText(text)
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.output_text.setTextCursor(cursor)
         self.output_text.ensureCursorVisible()
 
+    def _set_status_state(self, state: str):
+        """
+        Re-polish the status label against one of the stylesheet states.
+
+        Args:
+            state: One of "ok", "err" or "cancel"
+        """
+        self.status_label.setProperty("state", state)
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
+
     def set_status(self, status: str):
         """
         Set the status label text.
@@ -116,6 +163,7 @@ class ProgressDialog(QDialog):
 
     def download_started(self):
         """Handle download start."""
+        self._flush_timer.start()
         self.status_label.setText("Downloading mods...")
         self.cancel_button.setEnabled(True)
         self.close_button.setEnabled(False)
@@ -130,24 +178,21 @@ class ProgressDialog(QDialog):
         """
         if success:
             self.status_label.setText("✓ Download completed successfully!")
-            self.status_label.setStyleSheet(
-                "font-weight: bold; font-size: 12pt; color: green;"
-            )
+            self._set_status_state("ok")
         else:
             self.status_label.setText(f"✗ Download failed: {message}")
-            self.status_label.setStyleSheet(
-                "font-weight: bold; font-size: 12pt; color: red;"
-            )
+            self._set_status_state("err")
 
+        self._flush_timer.stop()
         self.append_output(f"\n{message}\n")
         self.cancel_button.setEnabled(False)
         self.close_button.setEnabled(True)
 
     def download_cancelled(self):
         """Handle download cancellation."""
+        self._flush_timer.stop()
+        self._flush()
         self.status_label.setText("✗ Download cancelled")
-        self.status_label.setStyleSheet(
-            "font-weight: bold; font-size: 12pt; color: orange;"
-        )
+        self._set_status_state("cancel")
         self.cancel_button.setEnabled(False)
         self.close_button.setEnabled(True)
@@ -7,7 +7,9 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[
+        ('ui/dark.qss', 'ui'),
+    ],
     hiddenimports=[
         'PySide6.QtCore',
         'PySide6.QtGui',